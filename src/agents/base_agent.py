@@ -2,7 +2,7 @@ import uuid
 from typing import Dict, List, Any, Optional, Union, Callable
 from abc import ABC, abstractmethod
 
-from crewai import Agent as CrewAgent
+from crewai import Agent as CrewAgent, LLM
 from crewai.tools import BaseTool
 
 from src.config.config import (
@@ -34,7 +34,9 @@ class BaseAgent(ABC):
         max_iterations: int = MAX_AGENT_ITERATIONS,
         max_execution_time: int = MAX_AGENT_EXECUTION_TIME,
         rpm_limit: int = AGENT_RPM_LIMIT,
-        step_callback: Optional[Callable] = None
+        step_callback: Optional[Callable] = None,
+        client: Optional[LLM] = None,
+        model_config: Optional[Dict[str, Any]] = None
     ):
         """
         Initialize the base agent.
@@ -54,12 +56,27 @@ class BaseAgent(ABC):
             max_execution_time (int): Maximum execution time in seconds
             rpm_limit (int): Rate limit for API calls
             step_callback (Callable): Callback function for each step
+            client (LLM, optional): Shared LLM client for the model. If not provided,
+                CrewAI creates one for this agent from the model name.
+            model_config (Dict[str, Any], optional): Per-model settings from MODEL_CONFIGS. Any of
+                temperature, max_tokens, max_iterations, max_execution_time and rpm_limit set here
+                override the arguments above.
         """
+        # Per-model settings take precedence over the defaults
+        if model_config:
+            temperature = model_config.get("temperature", temperature)
+            max_tokens = model_config.get("max_tokens", max_tokens)
+            max_iterations = model_config.get("max_iterations", max_iterations)
+            max_execution_time = model_config.get("max_execution_time", max_execution_time)
+            rpm_limit = model_config.get("rpm_limit", rpm_limit)
+        
         self.id = str(uuid.uuid4())
         self.role = role
         self.goal = goal
         self.backstory = backstory
         self.tools = tools or []
+        self.llm = llm
+        self.temperature = temperature
         
         # Create the CrewAI agent
         self.agent = CrewAgent(
@@ -69,7 +86,7 @@ class BaseAgent(ABC):
             memory=memory,
             verbose=verbose,
             allow_delegation=allow_delegation,
-            llm=llm,
+            llm=client or llm,
             tools=self.tools,
             max_iter=max_iterations,
             max_execution_time=max_execution_time,
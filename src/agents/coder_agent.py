@@ -6,7 +6,8 @@ from pathlib import Path
 from crewai.tasks import Task
 
 from src.agents.base_agent import BaseAgent
-from src.tools.brave_search_tool import BraveSearchTool
+from src.config.config import config
+from src.tools.brave_search_tool import BraveSearchTool, BraveSearchBatchTool
 from src.tools.sequential_thinking_tool import SequentialThinkingTool
 from src.tools.context7_tool import Context7Tool
 from src.utils.logging_utils import setup_logger
@@ -51,6 +52,7 @@ class CoderAgent(BaseAgent):
         
         # Add required tools
         self.add_tool(BraveSearchTool())
+        self.add_tool(BraveSearchBatchTool())
         self.add_tool(SequentialThinkingTool())
         self.add_tool(Context7Tool())
         
@@ -63,13 +65,15 @@ class CoderAgent(BaseAgent):
         self.current_task = None
         self.locked_files = {}
     
-    def run(self, task: Dict[str, Any], file_access: List[str]) -> Dict[str, Any]:
+    def run(self, task: Dict[str, Any], file_access: List[str],
+            file_contents: Optional[Dict[str, bytes]] = None) -> Dict[str, Any]:
         """
         Implement a task from the Goal Graph.
         
         Args:
             task (Dict[str, Any]): The task to implement
             file_access (List[str]): Paths to files this agent can access
+            file_contents (Dict[str, bytes], optional): Current content of the accessible files, keyed by path
             
         Returns:
             Dict[str, Any]: Implementation results including status and any output
@@ -96,6 +100,7 @@ class CoderAgent(BaseAgent):
                 f"Task: {json.dumps(task, indent=2)}\n\n"
                 f"You have access to modify the following files:\n"
                 f"{', '.join(file_access)}\n\n"
+                f"{self._format_file_contents(file_contents)}"
                 f"Follow these steps:\n"
                 f"1. Use Sequential Thinking to break down the implementation approach\n"
                 f"2. Research and gather necessary documentation using Context7 and Brave Search\n"
@@ -205,13 +210,15 @@ class CoderAgent(BaseAgent):
         logger.info(f"Coder Agent completed code review with {len(review_report.get('issues', []))} issues found")
         return review_report
     
-    def fix_issues(self, issues: List[Dict[str, Any]], file_access: List[str]) -> Dict[str, Any]:
+    def fix_issues(self, issues: List[Dict[str, Any]], file_access: List[str],
+                   file_contents: Optional[Dict[str, bytes]] = None) -> Dict[str, Any]:
         """
         Fix issues identified in a code review.
         
         Args:
             issues (List[Dict[str, Any]]): List of issues to fix
             file_access (List[str]): Paths to files this agent can access
+            file_contents (Dict[str, bytes], optional): Current content of the accessible files, keyed by path
             
         Returns:
             Dict[str, Any]: Results of the fixes including fixed issues and any notes
@@ -234,6 +241,7 @@ class CoderAgent(BaseAgent):
                 f"Issues:\n{json.dumps(issues, indent=2)}\n\n"
                 f"You have access to modify the following files:\n"
                 f"{', '.join(file_access)}\n\n"
+                f"{self._format_file_contents(file_contents)}"
                 f"Follow these steps:\n"
                 f"1. Analyze each issue and determine the appropriate fix\n"
                 f"2. Implement the fixes in the affected files\n"
@@ -272,6 +280,27 @@ class CoderAgent(BaseAgent):
         logger.info(f"Coder Agent completed fixing {len(fix_report.get('fixed_issues', []))} issues")
         return fix_report
     
+    def _format_file_contents(self, file_contents: Optional[Dict[str, bytes]]) -> str:
+        """
+        Format prefetched file contents for inclusion in a task description.
+        
+        Args:
+            file_contents (Dict[str, bytes], optional): File content keyed by path
+            
+        Returns:
+            str: The formatted contents, or an empty string if there are none
+        """
+        if not file_contents:
+            return ""
+        
+        max_bytes = config.get('tools.max_file_bytes', 64 * 1024)
+        parts = ["Current content of these files:\n"]
+        for path, data in file_contents.items():
+            truncated = " (truncated)" if len(data) >= max_bytes else ""
+            parts.append(f"--- {path}{truncated} ---\n{data.decode('utf-8', errors='replace')}\n")
+        parts.append("\n")
+        return "\n".join(parts)
+    
     def _lock_files(self, files: List[str]) -> None:
         """
         Lock files for exclusive access.
@@ -79,10 +79,9 @@ class GoalerAgent(BaseAgent):
         # Create a task for the agent to perform
         validation_task = Task(
             description=(
-                f"Validate that the Goal Graph accurately represents a complete path to fulfilling "
-                f"the original user requirements in the PRD:\n\n"
-                f"PRD:\n{prd}\n\n"
-                f"Goal Graph:\n{json.dumps(goal_graph, indent=2)}\n\n"
+                f"{self._shared_context(prd, goal_graph)}"
+                f"Validate that the Goal Graph above accurately represents a complete path to fulfilling "
+                f"the original user requirements in the PRD.\n\n"
                 f"Follow these steps:\n"
                 f"1. Use Sequential Thinking to analyze the PRD thoroughly\n"
                 f"2. Identify all explicit and implicit requirements in the PRD\n"
@@ -197,12 +196,15 @@ class GoalerAgent(BaseAgent):
         logger.info(f"Goaler Agent completed review with {len(review_report.get('issues', []))} issues found")
         return review_report
     
-    def approve_goal_graph(self, goal_graph: Dict[str, Any]) -> Dict[str, Any]:
+    def approve_goal_graph(self, goal_graph: Dict[str, Any], prd: Optional[str] = None) -> Dict[str, Any]:
         """
         Approve the Goal Graph for implementation.
         
         Args:
             goal_graph (Dict[str, Any]): The Goal Graph to approve
+            prd (str, optional): The PRD the Goal Graph was validated against. When given, the
+                prompt starts with the same context as the validation prompt so the model server
+                can reuse its cached prefix.
             
         Returns:
             Dict[str, Any]: Approval status and any notes or recommendations
@@ -218,8 +220,8 @@ class GoalerAgent(BaseAgent):
         # Create a task for the agent to perform
         approval_task = Task(
             description=(
-                f"Review the Goal Graph one final time and provide formal approval for implementation:\n\n"
-                f"Goal Graph:\n{json.dumps(goal_graph, indent=2)}\n\n"
+                f"{self._shared_context(prd, goal_graph)}"
+                f"Review the Goal Graph above one final time and provide formal approval for implementation.\n\n"
                 f"Follow these steps:\n"
                 f"1. Review the Goal Graph for completeness and consistency\n"
                 f"2. Ensure all tasks have clear descriptions and appropriate dependencies\n"
@@ -255,6 +257,23 @@ class GoalerAgent(BaseAgent):
         logger.info(f"Goaler Agent completed Goal Graph approval: {approval_doc['approved']}")
         return approval_doc
     
+    def _shared_context(self, prd: Optional[str], goal_graph: Dict[str, Any]) -> str:
+        """
+        Build the context block that opens every Goaler prompt.
+        
+        Validation and approval prompts start with this identical block, so local model
+        servers that keep the KV cache of a previous prompt only process the instructions.
+        
+        Args:
+            prd (str, optional): The Product Requirements Document
+            goal_graph (Dict[str, Any]): The Goal Graph
+            
+        Returns:
+            str: The context block
+        """
+        context = f"PRD:\n{prd}\n\n" if prd is not None else ""
+        return f"{context}Goal Graph:\n{json.dumps(goal_graph, indent=2)}\n\n"
+    
     def _extract_json(self, text: str) -> Dict[str, Any]:
         """
         Extract a JSON object from a text response.
@@ -4,7 +4,7 @@ from typing import Dict, List, Any, Optional, Union
 from crewai.tasks import Task
 
 from src.agents.base_agent import BaseAgent
-from src.tools.brave_search_tool import BraveSearchTool
+from src.tools.brave_search_tool import BraveSearchTool, BraveSearchBatchTool
 from src.tools.sequential_thinking_tool import SequentialThinkingTool
 from src.utils.logging_utils import setup_logger
 from src.utils.memory_utils import MemoryManager
@@ -47,6 +47,7 @@ class RequirementerAgent(BaseAgent):
         
         # Add required tools
         self.add_tool(BraveSearchTool())
+        self.add_tool(BraveSearchBatchTool())
         self.add_tool(SequentialThinkingTool())
         
         # Initialize memory manager
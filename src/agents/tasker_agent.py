@@ -2,6 +2,8 @@ import os
 from typing import Dict, List, Any, Optional, Union
 import json
 
+import orjson
+
 from crewai.tasks import Task
 
 from src.agents.base_agent import BaseAgent
@@ -385,15 +387,18 @@ class TaskerAgent(BaseAgent):
         latest_path = self.goal_graph_dir / "latest.json"
         
         try:
+            # Serialize once for both files
+            data = orjson.dumps(goal_graph, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            
             # Save the timestamped version
             with file_lock(file_path, self.id):
-                with open(file_path, 'w') as f:
-                    json.dump(goal_graph, f, indent=2)
+                with open(file_path, 'wb') as f:
+                    f.write(data)
             
             # Save as latest
             with file_lock(latest_path, self.id):
-                with open(latest_path, 'w') as f:
-                    json.dump(goal_graph, f, indent=2)
+                with open(latest_path, 'wb') as f:
+                    f.write(data)
             
             logger.info(f"Goal Graph saved to {file_path} and {latest_path}")
             
@@ -418,9 +423,9 @@ class TaskerAgent(BaseAgent):
         
         try:
             with file_lock(file_path, self.id, exclusive=False):
-                with open(file_path, 'r') as f:
-                    return json.load(f)
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
                 
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, IOError) as e:
             logger.error(f"Error loading Goal Graph: {e}")
             return {"tasks": []} 
\ No newline at end of file
@@ -171,23 +171,57 @@ class Config:
         config['ollama'].setdefault('enabled', True)
         config['ollama'].setdefault('model', 'qwen3:8b')
         config['ollama'].setdefault('server_url', 'http://localhost:11434')
+        config['ollama'].setdefault('availability_ttl', 60)  # seconds
+        config['ollama'].setdefault('keep_alive', '30m')  # -1 keeps the model loaded indefinitely
+        
+        # Tool defaults
+        config.setdefault('tools', {})
+        config['tools'].setdefault('executor_threads', 32)
+        config['tools'].setdefault('max_concurrent_reads', 16)
+        config['tools'].setdefault('max_file_bytes', 64 * 1024)  # bytes
+        
+        # HTTP client defaults
+        config.setdefault('http', {})
+        config['http'].setdefault('pool_connections', 10)
+        config['http'].setdefault('pool_maxsize', 50)
+        config['http'].setdefault('max_retries', 2)
+        config['http'].setdefault('backoff_factor', 0.2)
+        config['http'].setdefault('max_connections', 500)
+        config['http'].setdefault('max_keepalive', 100)
+        config['http'].setdefault('keepalive_expiry', 30)  # seconds
+        config['http'].setdefault('timeout', 30.0)  # seconds
+        
+        # LLM response cache defaults
+        config.setdefault('llm_cache', {})
+        config['llm_cache'].setdefault('enabled', True)
+        config['llm_cache'].setdefault('ttl', 24 * 60 * 60)  # seconds
         
         # MCP defaults
         config.setdefault('mcp', {})
         config['mcp'].setdefault('enabled', True)
+        config['mcp'].setdefault('max_in_flight', 8)  # Concurrent tool calls per server session
         
         # Brave Search MCP defaults
         config['mcp'].setdefault('brave_search', {})
         config['mcp']['brave_search'].setdefault('enabled', True)
         config['mcp']['brave_search'].setdefault('api_key', '')
+        config['mcp']['brave_search'].setdefault('cache_ttl', 300)  # seconds
+        config['mcp']['brave_search'].setdefault('cache_maxsize', 256)
         
         # Sequential Thinking MCP defaults
         config['mcp'].setdefault('sequential_thinking', {})
         config['mcp']['sequential_thinking'].setdefault('enabled', True)
+        config['mcp']['sequential_thinking'].setdefault('cache_ttl', 600)  # seconds
+        config['mcp']['sequential_thinking'].setdefault('cache_maxsize', 128)
         
         # Context7 MCP defaults
         config['mcp'].setdefault('context7', {})
         config['mcp']['context7'].setdefault('enabled', True)
+        config['mcp']['context7'].setdefault('library_id_cache_ttl', 24 * 60 * 60)  # seconds
+        config['mcp']['context7'].setdefault('docs_cache_ttl', 6 * 60 * 60)  # seconds
+        config['mcp']['context7'].setdefault('disk_cache', True)
+        config['mcp']['context7'].setdefault('disk_cache_size', 256 << 20)  # bytes
+        config['mcp']['context7'].setdefault('stream_threshold', 64 * 1024)  # bytes
         
         return config
     
@@ -7,12 +7,17 @@ This is the entry point for the Falcon Agent system.
 import os
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
 from src.config.config import config
 from src.utils.logging_utils import setup_logging
-from src.utils.ai_integration import OllamaIntegration, MCPServerIntegration
+from src.utils.ai_integration import (
+    OllamaIntegration, MCPServerIntegration, configure_event_loop, set_mcp_integration
+)
 from src.utils.agent_manager import AgentManager
+from src.utils.http_session import close_session
+from src.utils.http_client import close_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -26,37 +31,34 @@ async def setup_mcp_servers(mcp_integration: MCPServerIntegration) -> bool:
     Returns:
         bool: True if at least one server was set up successfully, False otherwise.
     """
-    success = False
+    mcp_config = config.get('mcp', {})
+    brave_search_config = mcp_config.get('brave_search', {})
+    server_configs = []
     
     # Set up Brave Search if enabled and API key is available
-    if config.get('mcp.brave_search.enabled', True) and config.get('mcp.brave_search.api_key'):
-        api_key = config.get('mcp.brave_search.api_key')
-        session = await mcp_integration.connect_brave_search(api_key)
-        if session:
-            logger.info("Brave Search MCP server connected successfully")
-            success = True
-        else:
-            logger.warning("Failed to connect to Brave Search MCP server")
+    api_key = brave_search_config.get('api_key')
+    if brave_search_config.get('enabled', True) and api_key:
+        server_configs.append({**MCPServerIntegration.BRAVE_SEARCH_SERVER, "env": {"BRAVE_API_KEY": api_key}})
     
     # Set up Sequential Thinking if enabled
-    if config.get('mcp.sequential_thinking.enabled', True):
-        session = await mcp_integration.connect_sequential_thinking()
-        if session:
-            logger.info("Sequential Thinking MCP server connected successfully")
-            success = True
-        else:
-            logger.warning("Failed to connect to Sequential Thinking MCP server")
+    if mcp_config.get('sequential_thinking', {}).get('enabled', True):
+        server_configs.append(MCPServerIntegration.SEQUENTIAL_THINKING_SERVER)
     
     # Set up Context7 if enabled
-    if config.get('mcp.context7.enabled', True):
-        session = await mcp_integration.connect_context7()
-        if session:
-            logger.info("Context7 MCP server connected successfully")
-            success = True
+    if mcp_config.get('context7', {}).get('enabled', True):
+        server_configs.append(MCPServerIntegration.CONTEXT7_SERVER)
+    
+    # Start the servers concurrently; each one's startup is dominated by npx and the handshake
+    sessions = await mcp_integration.connect_all(server_configs)
+    
+    for server_config in server_configs:
+        server_name = server_config["server_name"]
+        if server_name in sessions:
+            logger.info(f"{server_name} MCP server connected successfully")
         else:
-            logger.warning("Failed to connect to Context7 MCP server")
+            logger.warning(f"Failed to connect to {server_name} MCP server")
     
-    return success
+    return bool(sessions)
 
 async def main() -> None:
     """Main entry point for the Falcon Agent system."""
@@ -64,6 +66,11 @@ async def main() -> None:
     setup_logging(level=config.get('logging.level', 'INFO'))
     logger.info("Starting Falcon Agent system")
     
+    # Size the pool that blocking tool work is offloaded to
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=config.get('tools.executor_threads', 32))
+    )
+    
     # Initialize Ollama integration if enabled
     ollama_integration = None
     if config.get('ollama.enabled', True):
@@ -71,8 +78,8 @@ async def main() -> None:
         logger.info(f"Initializing Ollama with model: {model_name}")
         ollama_integration = OllamaIntegration(model_name)
         
-        # Ensure model is available (will pull if needed)
-        ollama_integration.pull_model()
+        # Pull the model if needed and load it so the first agent task does not wait for it
+        ollama_integration.warmup()
     else:
         logger.info("Ollama integration is disabled")
     
@@ -86,6 +93,9 @@ async def main() -> None:
         mcp_servers_ready = await setup_mcp_servers(mcp_integration)
         if not mcp_servers_ready:
             logger.warning("No MCP servers were successfully connected")
+        
+        # Let the tools reuse the connected sessions
+        set_mcp_integration(mcp_integration)
     else:
         logger.info("MCP server integration is disabled")
     
@@ -104,9 +114,16 @@ async def main() -> None:
         logger.error(f"Error during agent execution: {str(e)}", exc_info=True)
     finally:
         # Clean up
+        await agent_manager.aclose()
         if mcp_integration:
+            set_mcp_integration(None)
             await mcp_integration.close_all_sessions()
+        close_session()
+        await close_async_client()
         logger.info("Falcon Agent system shutdown complete")
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop where it is available (not on Windows)
+    configure_event_loop()
+    
     asyncio.run(main()) 
\ No newline at end of file
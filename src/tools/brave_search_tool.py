@@ -1,19 +1,44 @@
-import os
+import asyncio
+import threading
+import httpx
+import orjson
 import requests
-from typing import Dict, Any, Optional, Type, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Type, List, Tuple
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
-from src.config.config import BRAVE_SEARCH_API_KEY, BRAVE_SEARCH_MCP_URL
+from src.config.config import BRAVE_SEARCH_API_KEY, BRAVE_SEARCH_MCP_URL, config
 from src.utils.logging_utils import setup_logger
+from src.utils.http_session import get_session, JSON_HEADERS
+from src.utils.http_client import get_async_client
+from src.utils.ai_integration import get_mcp_integration
 
 logger = setup_logger(__name__)
 
+BRAVE_SEARCH_API_URL = "https://api.search.brave.com/res/v1/web/search"
+_SEARCH_URL = f"{BRAVE_SEARCH_MCP_URL}/search"
+_API_HEADERS = {"X-Subscription-Token": BRAVE_SEARCH_API_KEY}
+
+# Formatted results of recent searches, keyed by (query, count, offset)
+_CACHE = TTLCache(
+    maxsize=config.get('mcp.brave_search.cache_maxsize', 256),
+    ttl=config.get('mcp.brave_search.cache_ttl', 300)
+)
+_CACHE_LOCK = threading.Lock()
+
 class BraveSearchToolInput(BaseModel):
     """Input for the Brave Search Tool."""
     query: str = Field(..., description="The search query to use.")
-    count: int = Field(5, description="Number of search results to return (1-20).")
-    offset: int = Field(0, description="Starting offset for pagination (0-9).")
+    count: int = Field(5, ge=1, le=20, description="Number of search results to return (1-20).")
+    offset: int = Field(0, ge=0, le=9, description="Starting offset for pagination (0-9).")
+
+class BraveSearchBatchToolInput(BaseModel):
+    """Input for the Brave Search Batch Tool."""
+    queries: List[str] = Field(..., description="The search queries to run together.")
+    count: int = Field(5, ge=1, le=20, description="Number of search results to return per query (1-20).")
+    offset: int = Field(0, ge=0, le=9, description="Starting offset for pagination (0-9).")
 
 class BraveSearchTool(BaseTool):
     """
@@ -38,21 +63,93 @@ class BraveSearchTool(BaseTool):
             str: Search results in a formatted string
         """
         try:
-            # Ensure valid parameter values
-            count = min(max(count, 1), 20)  # between 1 and 20
-            offset = min(max(offset, 0), 9)  # between 0 and 9
+            # Serve repeated searches from the cache
+            key = self._cache_key(query, count, offset)
+            with _CACHE_LOCK:
+                cached = _CACHE.get(key)
+            if cached is not None:
+                return cached
             
             # Call the Brave Search MCP server
             response = self._call_brave_search_mcp(query, count, offset)
             
             # Format the results
             formatted_results = self._format_results(response)
+            with _CACHE_LOCK:
+                _CACHE[key] = formatted_results
             return formatted_results
             
         except Exception as e:
             logger.error(f"Error executing Brave Search: {str(e)}")
             return f"Error executing search: {str(e)}"
     
+    async def _arun(self, query: str, count: int = 5, offset: int = 0) -> str:
+        """
+        Execute the web search without blocking the event loop.
+        
+        Args:
+            query (str): The search query
+            count (int): Number of results to return (1-20)
+            offset (int): Starting offset for pagination (0-9)
+            
+        Returns:
+            str: Search results in a formatted string
+        """
+        try:
+            # Serve repeated searches from the cache
+            key = self._cache_key(query, count, offset)
+            with _CACHE_LOCK:
+                cached = _CACHE.get(key)
+            if cached is not None:
+                return cached
+            
+            # Prefer the long-lived MCP session when one is connected
+            formatted_results = await self._acall_brave_search_session(query, count, offset)
+            
+            if formatted_results is None:
+                # Call the Brave Search MCP server
+                response = await self._acall_brave_search_mcp(query, count, offset)
+                
+                # Format the results
+                formatted_results = self._format_results(response)
+            
+            with _CACHE_LOCK:
+                _CACHE[key] = formatted_results
+            return formatted_results
+            
+        except Exception as e:
+            logger.error(f"Error executing Brave Search: {str(e)}")
+            return f"Error executing search: {str(e)}"
+    
+    async def batch_search(self, queries: List[Tuple[str, int, int]]) -> List[str]:
+        """
+        Run several searches concurrently over the shared async client.
+        
+        Args:
+            queries (List[Tuple[str, int, int]]): (query, count, offset) tuples
+            
+        Returns:
+            List[str]: Formatted results, in the same order as the queries
+        """
+        return await asyncio.gather(
+            *(self._arun(query, count, offset) for query, count, offset in queries)
+        )
+    
+    @staticmethod
+    def _cache_key(query: str, count: int, offset: int) -> Tuple[str, int, int]:
+        """
+        Build the cache key for a search.
+        
+        Args:
+            query (str): The search query
+            count (int): Number of results to return
+            offset (int): Starting offset for pagination
+            
+        Returns:
+            Tuple[str, int, int]: The normalized cache key
+        """
+        return (query.strip().lower(), count, offset)
+    
     def _call_brave_search_mcp(self, query: str, count: int, offset: int) -> Dict[str, Any]:
         """
         Call the Brave Search MCP server.
@@ -71,14 +168,13 @@ class BraveSearchTool(BaseTool):
         
         # Using MCP server
         try:
-            mcp_endpoint = f"{BRAVE_SEARCH_MCP_URL}/search"
             payload = {
                 "query": query,
                 "count": count,
                 "offset": offset
             }
             
-            response = requests.post(mcp_endpoint, json=payload)
+            response = get_session().post(_SEARCH_URL, data=orjson.dumps(payload), headers=JSON_HEADERS)
             response.raise_for_status()
             
             return response.json()
@@ -106,15 +202,97 @@ class BraveSearchTool(BaseTool):
         if not BRAVE_SEARCH_API_KEY:
             raise ValueError("Brave Search API key not set")
         
-        api_url = "https://api.search.brave.com/res/v1/web/search"
-        headers = {"Accept": "application/json", "X-Subscription-Token": BRAVE_SEARCH_API_KEY}
         params = {
             "q": query,
             "count": count,
             "offset": offset
         }
         
-        response = requests.get(api_url, headers=headers, params=params)
+        response = get_session().get(BRAVE_SEARCH_API_URL, headers=_API_HEADERS, params=params)
+        response.raise_for_status()
+        
+        return response.json()
+    
+    async def _acall_brave_search_session(self, query: str, count: int, offset: int) -> Optional[str]:
+        """
+        Search through the Brave Search MCP session connected at startup.
+        
+        Args:
+            query (str): The search query
+            count (int): Number of results to return
+            offset (int): Starting offset for pagination
+            
+        Returns:
+            Optional[str]: The search results, or None if no session is connected or the call failed
+        """
+        mcp_integration = get_mcp_integration()
+        if mcp_integration is None or not mcp_integration.has_session("brave-search"):
+            return None
+        
+        text = await mcp_integration.call_tool_text(
+            "brave-search",
+            "brave_web_search",
+            {"query": query, "count": count, "offset": offset}
+        )
+        if not text:
+            return None
+        
+        return f"## Search Results\n\n{text}\n"
+    
+    async def _acall_brave_search_mcp(self, query: str, count: int, offset: int) -> Dict[str, Any]:
+        """
+        Call the Brave Search MCP server using the shared async client.
+        
+        Args:
+            query (str): The search query
+            count (int): Number of results to return
+            offset (int): Starting offset for pagination
+            
+        Returns:
+            Dict[str, Any]: The response from the MCP server
+        """
+        # If we're using direct API
+        if BRAVE_SEARCH_API_KEY:
+            return await self._acall_brave_search_api(query, count, offset)
+        
+        payload = {
+            "query": query,
+            "count": count,
+            "offset": offset
+        }
+        
+        try:
+            response = await get_async_client().post(_SEARCH_URL, content=orjson.dumps(payload), headers=JSON_HEADERS)
+            response.raise_for_status()
+            
+            return response.json()
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Error calling Brave Search MCP: {str(e)}")
+            raise
+    
+    async def _acall_brave_search_api(self, query: str, count: int, offset: int) -> Dict[str, Any]:
+        """
+        Call the Brave Search API directly using the shared async client.
+        
+        Args:
+            query (str): The search query
+            count (int): Number of results to return
+            offset (int): Starting offset for pagination
+            
+        Returns:
+            Dict[str, Any]: The response from the API
+        """
+        if not BRAVE_SEARCH_API_KEY:
+            raise ValueError("Brave Search API key not set")
+        
+        params = {
+            "q": query,
+            "count": count,
+            "offset": offset
+        }
+        
+        response = await get_async_client().get(BRAVE_SEARCH_API_URL, headers=_API_HEADERS, params=params)
         response.raise_for_status()
         
         return response.json()
@@ -133,15 +311,76 @@ class BraveSearchTool(BaseTool):
             return "No search results found."
         
         results = response.get("results", [])
-        formatted_results = "## Search Results\n\n"
+        parts = ["## Search Results\n\n"]
+        parts.extend(
+            f"### {i}. {result.get('title', 'No Title')}\n"
+            f"URL: {result.get('url', '')}\n"
+            f"Description: {result.get('description', 'No description available.')}\n\n"
+            for i, result in enumerate(results, 1)
+        )
+        
+        return "".join(parts) 
+
+
+class BraveSearchBatchTool(BaseTool):
+    """
+    Tool to run a burst of related web searches in one call.
+    The searches are issued concurrently instead of one after another.
+    """
+    
+    name: str = "brave_search_batch"
+    description: str = "Search the web for several related queries at once using Brave Search."
+    args_schema: Type[BaseModel] = BraveSearchBatchToolInput
+    
+    def _run(self, queries: List[str], count: int = 5, offset: int = 0) -> str:
+        """
+        Execute the web searches on worker threads.
+        
+        Args:
+            queries (List[str]): The search queries
+            count (int): Number of results to return per query (1-20)
+            offset (int): Starting offset for pagination (0-9)
+            
+        Returns:
+            str: Search results for every query in a formatted string
+        """
+        if not queries:
+            return "No search queries provided."
+        
+        search_tool = BraveSearchTool()
+        max_workers = min(len(queries), config.get('http.pool_maxsize', 50))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda query: search_tool._run(query, count, offset), queries))
+        
+        return self._format_batch(queries, results)
+    
+    async def _arun(self, queries: List[str], count: int = 5, offset: int = 0) -> str:
+        """
+        Execute the web searches concurrently on the event loop.
         
-        for i, result in enumerate(results, 1):
-            title = result.get("title", "No Title")
-            url = result.get("url", "")
-            description = result.get("description", "No description available.")
+        Args:
+            queries (List[str]): The search queries
+            count (int): Number of results to return per query (1-20)
+            offset (int): Starting offset for pagination (0-9)
             
-            formatted_results += f"### {i}. {title}\n"
-            formatted_results += f"URL: {url}\n"
-            formatted_results += f"Description: {description}\n\n"
+        Returns:
+            str: Search results for every query in a formatted string
+        """
+        if not queries:
+            return "No search queries provided."
+        
+        results = await BraveSearchTool().batch_search([(query, count, offset) for query in queries])
+        return self._format_batch(queries, results)
+    
+    def _format_batch(self, queries: List[str], results: List[str]) -> str:
+        """
+        Combine the formatted results of each query.
         
-        return formatted_results 
\ No newline at end of file
+        Args:
+            queries (List[str]): The search queries
+            results (List[str]): Formatted results for each query
+            
+        Returns:
+            str: Combined search results
+        """
+        return "\n".join(f"# Query: {query}\n\n{result}" for query, result in zip(queries, results))
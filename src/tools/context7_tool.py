@@ -1,20 +1,158 @@
-import os
-import json
+import asyncio
+import threading
+import httpx
+import ijson
+import orjson
 import requests
-from typing import Dict, Any, Optional, Type, List
+from typing import Dict, Any, Optional, Type, Union
+from cachetools import TTLCache
+from jinja2 import Environment
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
-from src.config.config import CONTEXT7_MCP_URL
+from src.config.config import CONTEXT7_MCP_URL, DATA_DIR, config
 from src.utils.logging_utils import setup_logger
+from src.utils.http_session import get_session, JSON_HEADERS
+from src.utils.http_client import get_async_client
 
 logger = setup_logger(__name__)
 
+_RESOLVE_URL = f"{CONTEXT7_MCP_URL}/resolve-library-id"
+_DOCS_URL = f"{CONTEXT7_MCP_URL}/get-library-docs"
+
+# Markdown layout for documentation sections, compiled once at import
+_DOCS_TEMPLATE = Environment(autoescape=False, keep_trailing_newline=True).from_string(
+    "## Documentation for {{ library_name }}\n\n"
+    "{% for section in sections %}"
+    "### {{ section.get('title', 'Untitled Section') }}\n"
+    "{% if section.get('description') %}{{ section.description }}\n\n{% endif %}"
+    "{% if section.get('source') %}Source: {{ section.source }}\n\n{% endif %}"
+    "{% if section.get('code') %}```{{ section.get('language', '') }}\n{{ section.code }}\n```\n\n{% endif %}"
+    "---\n\n"
+    "{% endfor %}"
+)
+
+# Library IDs rarely change; documentation pages are large but stable
+LIBRARY_ID_CACHE_TTL = config.get('mcp.context7.library_id_cache_ttl', 24 * 60 * 60)
+DOCS_CACHE_TTL = config.get('mcp.context7.docs_cache_ttl', 6 * 60 * 60)
+
+# Docs payloads at least this large are parsed incrementally while downloading
+STREAM_THRESHOLD = config.get('mcp.context7.stream_threshold', 64 * 1024)
+
+# In-memory tier, checked before the on-disk tier
+_LIBRARY_ID_CACHE = TTLCache(maxsize=256, ttl=LIBRARY_ID_CACHE_TTL)
+_DOCS_CACHE = TTLCache(maxsize=64, ttl=DOCS_CACHE_TTL)
+# Rendered markdown, keyed by (library_name, topic, tokens), so docs cache hits skip re-rendering
+_FORMATTED_CACHE = TTLCache(maxsize=64, ttl=DOCS_CACHE_TTL)
+_CACHE_LOCK = threading.Lock()
+
+# On-disk tier, shared across processes; opened on first use
+_DISK_CACHE = None
+
+
+def _get_disk_cache():
+    """
+    Get the on-disk cache tier, opening it on first use.
+    
+    Importing diskcache and creating the cache directory is deferred so that
+    importing this module stays cheap when the tool is never called.
+    
+    Returns:
+        Optional[diskcache.Cache]: The disk cache, or None if disabled
+    """
+    global _DISK_CACHE
+    
+    if _DISK_CACHE is None and config.get('mcp.context7.disk_cache', True):
+        from diskcache import Cache
+        
+        with _CACHE_LOCK:
+            if _DISK_CACHE is None:
+                _DISK_CACHE = Cache(
+                    str(DATA_DIR / "cache" / "context7"),
+                    size_limit=config.get('mcp.context7.disk_cache_size', 256 << 20)
+                )
+    return _DISK_CACHE
+
+
+class _AsyncByteReader:
+    """Adapts an httpx response body to the async ``read`` interface ijson expects."""
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk for it
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+def _is_small(response: Union[requests.Response, httpx.Response]) -> bool:
+    """
+    Check whether a response is small enough to parse in one go.
+    
+    Args:
+        response (Union[requests.Response, httpx.Response]): The streamed response
+        
+    Returns:
+        bool: True if the declared length is below STREAM_THRESHOLD
+    """
+    content_length = response.headers.get("Content-Length")
+    return content_length is not None and int(content_length) < STREAM_THRESHOLD
+
+
+def _cache_get(memory_cache: TTLCache, key: str) -> Optional[Any]:
+    """
+    Look up a value in the in-memory tier, then the on-disk tier.
+    
+    Args:
+        memory_cache (TTLCache): The in-memory tier to check first
+        key (str): The cache key
+        
+    Returns:
+        Optional[Any]: The cached value or None on a miss
+    """
+    with _CACHE_LOCK:
+        value = memory_cache.get(key)
+    if value is not None:
+        return value
+    
+    disk_cache = _get_disk_cache()
+    if disk_cache is None:
+        return None
+    
+    value = disk_cache.get(key)
+    if value is not None:
+        # Promote to the in-memory tier
+        with _CACHE_LOCK:
+            memory_cache[key] = value
+    return value
+
+
+def _cache_set(memory_cache: TTLCache, key: str, value: Any, expire: int) -> None:
+    """
+    Store a value in both cache tiers.
+    
+    Args:
+        memory_cache (TTLCache): The in-memory tier
+        key (str): The cache key
+        value (Any): The value to store
+        expire (int): Expiry for the on-disk tier in seconds
+    """
+    with _CACHE_LOCK:
+        memory_cache[key] = value
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.set(key, value, expire=expire)
+
 class Context7Input(BaseModel):
     """Input for the Context7 Tool."""
     library_name: str = Field(..., description="The name of the library to get documentation for.")
     topic: str = Field("", description="Specific topic or function to focus on (optional).")
-    tokens: int = Field(5000, description="Maximum number of tokens to retrieve.")
+    tokens: int = Field(5000, ge=1000, le=10000, description="Maximum number of tokens to retrieve (1000-10000).")
 
 class Context7Tool(BaseTool):
     """
@@ -38,8 +176,12 @@ class Context7Tool(BaseTool):
             str: The documentation content
         """
         try:
-            # Ensure valid parameter values
-            tokens = min(max(tokens, 1000), 10000)  # between 1000 and 10000
+            # Serve previously rendered documentation
+            key = (library_name, topic, tokens)
+            with _CACHE_LOCK:
+                cached = _FORMATTED_CACHE.get(key)
+            if cached is not None:
+                return cached
             
             # Resolve the library ID first
             library_id = self._resolve_library_id(library_name)
@@ -51,12 +193,66 @@ class Context7Tool(BaseTool):
             
             # Format the results
             formatted_results = self._format_results(response, library_name)
+            if not response.get("error"):
+                with _CACHE_LOCK:
+                    _FORMATTED_CACHE[key] = formatted_results
+            return formatted_results
+            
+        except Exception as e:
+            logger.error(f"Error retrieving documentation: {str(e)}")
+            return f"Error retrieving documentation: {str(e)}"
+    
+    async def _arun(self, library_name: str, topic: str = "", tokens: int = 5000) -> str:
+        """
+        Retrieve programming documentation without blocking the event loop.
+        
+        Args:
+            library_name (str): The name of the library
+            topic (str): Specific topic or function to focus on
+            tokens (int): Maximum number of tokens to retrieve
+            
+        Returns:
+            str: The documentation content
+        """
+        try:
+            # Serve previously rendered documentation
+            key = (library_name, topic, tokens)
+            with _CACHE_LOCK:
+                cached = _FORMATTED_CACHE.get(key)
+            if cached is not None:
+                return cached
+            
+            # Resolve the library ID first
+            library_id = await self._aresolve_library_id(library_name)
+            if not library_id:
+                return f"Could not find documentation for library: {library_name}"
+            
+            # Retrieve the documentation
+            response = await self._aget_library_docs(library_id, topic, tokens)
+            
+            # Format the results
+            formatted_results = self._format_results(response, library_name)
+            if not response.get("error"):
+                with _CACHE_LOCK:
+                    _FORMATTED_CACHE[key] = formatted_results
             return formatted_results
             
         except Exception as e:
             logger.error(f"Error retrieving documentation: {str(e)}")
             return f"Error retrieving documentation: {str(e)}"
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear both the in-memory and on-disk documentation caches."""
+        with _CACHE_LOCK:
+            _LIBRARY_ID_CACHE.clear()
+            _DOCS_CACHE.clear()
+            _FORMATTED_CACHE.clear()
+        disk_cache = _get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.clear()
+        logger.info("Cleared Context7 documentation cache")
+    
     def _resolve_library_id(self, library_name: str) -> Optional[str]:
         """
         Resolve a library name to a Context7-compatible library ID.
@@ -67,13 +263,17 @@ class Context7Tool(BaseTool):
         Returns:
             Optional[str]: The resolved library ID or None if not found
         """
+        key = f"rid::{library_name.lower()}"
+        cached = _cache_get(_LIBRARY_ID_CACHE, key)
+        if cached is not None:
+            return cached
+        
         try:
-            mcp_endpoint = f"{CONTEXT7_MCP_URL}/resolve-library-id"
             payload = {
                 "libraryName": library_name
             }
             
-            response = requests.post(mcp_endpoint, json=payload)
+            response = get_session().post(_RESOLVE_URL, data=orjson.dumps(payload), headers=JSON_HEADERS)
             response.raise_for_status()
             
             data = response.json()
@@ -81,7 +281,9 @@ class Context7Tool(BaseTool):
             # Extract the library ID from the response
             if "libraries" in data and data["libraries"]:
                 # Return the first match
-                return data["libraries"][0]["context7CompatibleLibraryID"]
+                library_id = data["libraries"][0]["context7CompatibleLibraryID"]
+                _cache_set(_LIBRARY_ID_CACHE, key, library_id, LIBRARY_ID_CACHE_TTL)
+                return library_id
             
             return None
             
@@ -101,8 +303,12 @@ class Context7Tool(BaseTool):
         Returns:
             Dict[str, Any]: The documentation data
         """
+        key = f"docs::{library_id}::{topic}::{tokens}"
+        cached = _cache_get(_DOCS_CACHE, key)
+        if cached is not None:
+            return cached
+        
         try:
-            mcp_endpoint = f"{CONTEXT7_MCP_URL}/get-library-docs"
             payload = {
                 "context7CompatibleLibraryID": library_id,
                 "tokens": tokens
@@ -111,12 +317,111 @@ class Context7Tool(BaseTool):
             if topic:
                 payload["topic"] = topic
             
-            response = requests.post(mcp_endpoint, json=payload)
+            with get_session().post(_DOCS_URL, data=orjson.dumps(payload), headers=JSON_HEADERS,
+                                    stream=True) as response:
+                response.raise_for_status()
+                
+                if _is_small(response):
+                    data = orjson.loads(response.content)
+                else:
+                    # Build the sections while downloading instead of buffering the raw body
+                    response.raw.decode_content = True
+                    data = dict(ijson.kvitems(response.raw, "", use_float=True))
+            
+            _cache_set(_DOCS_CACHE, key, data, DOCS_CACHE_TTL)
+            return data
+            
+        except (requests.RequestException, orjson.JSONDecodeError, ijson.JSONError) as e:
+            logger.error(f"Error retrieving library docs: {str(e)}")
+            # Return an empty response
+            return {
+                "library_id": library_id,
+                "topic": topic,
+                "sections": [],
+                "error": str(e)
+            }
+    
+    async def _aresolve_library_id(self, library_name: str) -> Optional[str]:
+        """
+        Resolve a library name to a Context7-compatible library ID using the shared async client.
+        
+        Args:
+            library_name (str): The library name to resolve
+            
+        Returns:
+            Optional[str]: The resolved library ID or None if not found
+        """
+        key = f"rid::{library_name.lower()}"
+        cached = await asyncio.to_thread(_cache_get, _LIBRARY_ID_CACHE, key)
+        if cached is not None:
+            return cached
+        
+        try:
+            payload = {
+                "libraryName": library_name
+            }
+            
+            response = await get_async_client().post(_RESOLVE_URL, content=orjson.dumps(payload), headers=JSON_HEADERS)
             response.raise_for_status()
             
-            return response.json()
+            data = response.json()
             
-        except requests.RequestException as e:
+            # Extract the library ID from the response
+            if "libraries" in data and data["libraries"]:
+                # Return the first match
+                library_id = data["libraries"][0]["context7CompatibleLibraryID"]
+                await asyncio.to_thread(_cache_set, _LIBRARY_ID_CACHE, key, library_id, LIBRARY_ID_CACHE_TTL)
+                return library_id
+            
+            return None
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Error resolving library ID: {str(e)}")
+            return None
+    
+    async def _aget_library_docs(self, library_id: str, topic: str, tokens: int) -> Dict[str, Any]:
+        """
+        Retrieve documentation for a library using the shared async client.
+        
+        Args:
+            library_id (str): The Context7-compatible library ID
+            topic (str): Specific topic or function to focus on
+            tokens (int): Maximum number of tokens to retrieve
+            
+        Returns:
+            Dict[str, Any]: The documentation data
+        """
+        key = f"docs::{library_id}::{topic}::{tokens}"
+        cached = await asyncio.to_thread(_cache_get, _DOCS_CACHE, key)
+        if cached is not None:
+            return cached
+        
+        try:
+            payload = {
+                "context7CompatibleLibraryID": library_id,
+                "tokens": tokens
+            }
+            
+            if topic:
+                payload["topic"] = topic
+            
+            async with get_async_client().stream("POST", _DOCS_URL, content=orjson.dumps(payload),
+                                                 headers=JSON_HEADERS) as response:
+                response.raise_for_status()
+                
+                if _is_small(response):
+                    data = orjson.loads(await response.aread())
+                else:
+                    # Build the sections while downloading instead of buffering the raw body
+                    data = {
+                        name: value
+                        async for name, value in ijson.kvitems_async(_AsyncByteReader(response), "", use_float=True)
+                    }
+            
+            await asyncio.to_thread(_cache_set, _DOCS_CACHE, key, data, DOCS_CACHE_TTL)
+            return data
+            
+        except (httpx.HTTPError, orjson.JSONDecodeError, ijson.JSONError) as e:
             logger.error(f"Error retrieving library docs: {str(e)}")
             # Return an empty response
             return {
@@ -143,31 +448,4 @@ class Context7Tool(BaseTool):
         if not response or "sections" not in response or not response["sections"]:
             return f"No documentation found for {library_name}."
         
-        sections = response.get("sections", [])
-        
-        formatted_results = f"## Documentation for {library_name}\n\n"
-        
-        for section in sections:
-            title = section.get("title", "Untitled Section")
-            language = section.get("language", "")
-            code = section.get("code", "")
-            description = section.get("description", "")
-            source = section.get("source", "")
-            
-            formatted_results += f"### {title}\n"
-            
-            if description:
-                formatted_results += f"{description}\n\n"
-            
-            if source:
-                formatted_results += f"Source: {source}\n\n"
-            
-            if code:
-                if language:
-                    formatted_results += f"```{language}\n{code}\n```\n\n"
-                else:
-                    formatted_results += f"```\n{code}\n```\n\n"
-            
-            formatted_results += "---\n\n"
-        
-        return formatted_results 
\ No newline at end of file
+        return _DOCS_TEMPLATE.render(library_name=library_name, sections=response["sections"]) 
\ No newline at end of file
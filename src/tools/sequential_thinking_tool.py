@@ -1,20 +1,45 @@
-import os
-import json
+import hashlib
+import threading
+import httpx
+import orjson
 import requests
-from typing import Dict, Any, Optional, Type, List
+from typing import Dict, Any, Type, List, Union
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
-from src.config.config import SEQ_THINKING_MCP_URL
+from src.config.config import SEQ_THINKING_MCP_URL, config
 from src.utils.logging_utils import setup_logger
+from src.utils.http_session import get_session, JSON_HEADERS
+from src.utils.http_client import get_async_client
 
 logger = setup_logger(__name__)
 
+_THINK_URL = f"{SEQ_THINKING_MCP_URL}/think"
+
+# Formatted analyses, keyed by a digest of (problem, context, max_steps)
+_CACHE = TTLCache(
+    maxsize=config.get('mcp.sequential_thinking.cache_maxsize', 128),
+    ttl=config.get('mcp.sequential_thinking.cache_ttl', 600)
+)
+_CACHE_LOCK = threading.Lock()
+
+class ThinkingStep(BaseModel):
+    """A single step of a sequential analysis."""
+    step_number: int
+    thought: str
+
+class FallbackAnalysisResponse(BaseModel):
+    """Analysis produced locally when the Sequential Thinking MCP is unavailable."""
+    problem: str
+    steps: List[ThinkingStep]
+    conclusion: str
+
 class SequentialThinkingInput(BaseModel):
     """Input for the Sequential Thinking Tool."""
     problem: str = Field(..., description="The problem or question to analyze.")
     context: str = Field("", description="Additional context or background information.")
-    max_steps: int = Field(5, description="Maximum number of thinking steps to generate.")
+    max_steps: int = Field(5, ge=1, le=10, description="Maximum number of thinking steps to generate (1-10).")
 
 class SequentialThinkingTool(BaseTool):
     """
@@ -38,21 +63,81 @@ class SequentialThinkingTool(BaseTool):
             str: The analysis result
         """
         try:
-            # Ensure valid parameter values
-            max_steps = min(max(max_steps, 1), 10)  # between 1 and 10
+            # Serve repeated analyses from the cache
+            key = self._cache_key(problem, context, max_steps)
+            with _CACHE_LOCK:
+                cached = _CACHE.get(key)
+            if cached is not None:
+                return cached
             
             # Call the Sequential Thinking MCP
             response = self._call_sequential_thinking_mcp(problem, context, max_steps)
             
             # Format the results
             formatted_results = self._format_results(response)
+            
+            # Don't keep the fallback around once the MCP server is back
+            if not isinstance(response, FallbackAnalysisResponse):
+                with _CACHE_LOCK:
+                    _CACHE[key] = formatted_results
+            return formatted_results
+            
+        except Exception as e:
+            logger.error(f"Error executing Sequential Thinking: {str(e)}")
+            return f"Error during analysis: {str(e)}"
+    
+    async def _arun(self, problem: str, context: str = "", max_steps: int = 5) -> str:
+        """
+        Execute the Sequential Thinking process without blocking the event loop.
+        
+        Args:
+            problem (str): The problem or question to analyze
+            context (str): Additional context or background information
+            max_steps (int): Maximum number of thinking steps to generate
+            
+        Returns:
+            str: The analysis result
+        """
+        try:
+            # Serve repeated analyses from the cache
+            key = self._cache_key(problem, context, max_steps)
+            with _CACHE_LOCK:
+                cached = _CACHE.get(key)
+            if cached is not None:
+                return cached
+            
+            # Call the Sequential Thinking MCP
+            response = await self._acall_sequential_thinking_mcp(problem, context, max_steps)
+            
+            # Format the results
+            formatted_results = self._format_results(response)
+            
+            # Don't keep the fallback around once the MCP server is back
+            if not isinstance(response, FallbackAnalysisResponse):
+                with _CACHE_LOCK:
+                    _CACHE[key] = formatted_results
             return formatted_results
             
         except Exception as e:
             logger.error(f"Error executing Sequential Thinking: {str(e)}")
             return f"Error during analysis: {str(e)}"
     
-    def _call_sequential_thinking_mcp(self, problem: str, context: str, max_steps: int) -> Dict[str, Any]:
+    @staticmethod
+    def _cache_key(problem: str, context: str, max_steps: int) -> str:
+        """
+        Build the cache key for an analysis.
+        
+        Args:
+            problem (str): The problem or question to analyze
+            context (str): Additional context or background information
+            max_steps (int): Maximum number of thinking steps to generate
+            
+        Returns:
+            str: A digest of the inputs
+        """
+        return hashlib.sha1(f"{problem}|{context}|{max_steps}".encode("utf-8")).hexdigest()
+    
+    def _call_sequential_thinking_mcp(self, problem: str, context: str, max_steps: int) -> Union[Dict[str, Any], FallbackAnalysisResponse]:
         """
         Call the Sequential Thinking MCP server.
         
@@ -62,17 +147,17 @@ class SequentialThinkingTool(BaseTool):
             max_steps (int): Maximum number of thinking steps to generate
             
         Returns:
-            Dict[str, Any]: The response from the MCP server
+            Union[Dict[str, Any], FallbackAnalysisResponse]: The response from the MCP server,
+                or the fallback analysis if the server is unavailable
         """
         try:
-            mcp_endpoint = f"{SEQ_THINKING_MCP_URL}/think"
             payload = {
                 "problem": problem,
                 "context": context,
                 "max_steps": max_steps
             }
             
-            response = requests.post(mcp_endpoint, json=payload)
+            response = get_session().post(_THINK_URL, data=orjson.dumps(payload), headers=JSON_HEADERS)
             response.raise_for_status()
             
             return response.json()
@@ -82,7 +167,37 @@ class SequentialThinkingTool(BaseTool):
             # If MCP fails, perform a simple step-by-step analysis
             return self._fallback_analysis(problem, context, max_steps)
     
-    def _fallback_analysis(self, problem: str, context: str, max_steps: int) -> Dict[str, Any]:
+    async def _acall_sequential_thinking_mcp(self, problem: str, context: str, max_steps: int) -> Union[Dict[str, Any], FallbackAnalysisResponse]:
+        """
+        Call the Sequential Thinking MCP server using the shared async client.
+        
+        Args:
+            problem (str): The problem or question to analyze
+            context (str): Additional context or background information
+            max_steps (int): Maximum number of thinking steps to generate
+            
+        Returns:
+            Union[Dict[str, Any], FallbackAnalysisResponse]: The response from the MCP server,
+                or the fallback analysis if the server is unavailable
+        """
+        try:
+            payload = {
+                "problem": problem,
+                "context": context,
+                "max_steps": max_steps
+            }
+            
+            response = await get_async_client().post(_THINK_URL, content=orjson.dumps(payload), headers=JSON_HEADERS)
+            response.raise_for_status()
+            
+            return response.json()
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Error calling Sequential Thinking MCP: {str(e)}")
+            # If MCP fails, perform a simple step-by-step analysis
+            return self._fallback_analysis(problem, context, max_steps)
+    
+    def _fallback_analysis(self, problem: str, context: str, max_steps: int) -> FallbackAnalysisResponse:
         """
         Fallback method if the MCP server is unavailable.
         Performs a simple step-by-step analysis.
@@ -93,63 +208,63 @@ class SequentialThinkingTool(BaseTool):
             max_steps (int): Maximum number of thinking steps to generate
             
         Returns:
-            Dict[str, Any]: A structured analysis result
+            FallbackAnalysisResponse: A structured analysis result
         """
         logger.warning("Using fallback analysis method")
         
         # In a real implementation, this would use the LLM to generate steps
         # For now, we'll just return a simple structure
         steps = [
-            {
-                "step_number": 1,
-                "thought": f"First, let's understand the problem: {problem}"
-            }
+            ThinkingStep(
+                step_number=1,
+                thought=f"First, let's understand the problem: {problem}"
+            )
         ]
         
         if context:
-            steps.append({
-                "step_number": 2,
-                "thought": f"Considering the context: {context}"
-            })
+            steps.append(ThinkingStep(
+                step_number=2,
+                thought=f"Considering the context: {context}"
+            ))
         
-        steps.append({
-            "step_number": len(steps) + 1,
-            "thought": "Without the Sequential Thinking MCP, I can't perform a thorough analysis. "
-                      "Please ensure the MCP server is properly configured and running."
-        })
+        steps.append(ThinkingStep(
+            step_number=len(steps) + 1,
+            thought="Without the Sequential Thinking MCP, I can't perform a thorough analysis. "
+                    "Please ensure the MCP server is properly configured and running."
+        ))
         
-        return {
-            "problem": problem,
-            "steps": steps,
-            "conclusion": "Analysis incomplete due to unavailable MCP server."
-        }
+        return FallbackAnalysisResponse(
+            problem=problem,
+            steps=steps,
+            conclusion="Analysis incomplete due to unavailable MCP server."
+        )
     
-    def _format_results(self, response: Dict[str, Any]) -> str:
+    def _format_results(self, response: Union[Dict[str, Any], FallbackAnalysisResponse]) -> str:
         """
         Format the analysis results in a readable format.
         
         Args:
-            response (Dict[str, Any]): The response from the MCP
+            response (Union[Dict[str, Any], FallbackAnalysisResponse]): The response from the MCP
+                or the fallback analysis
             
         Returns:
             str: Formatted analysis results
         """
+        if isinstance(response, FallbackAnalysisResponse):
+            response = response.model_dump()
+        
         if not response or "steps" not in response or not response["steps"]:
             return "No analysis results available."
         
         steps = response.get("steps", [])
         conclusion = response.get("conclusion", "No conclusion provided.")
         
-        formatted_results = "## Sequential Thinking Analysis\n\n"
-        
-        for step in steps:
-            step_number = step.get("step_number", "?")
-            thought = step.get("thought", "No thought provided.")
-            
-            formatted_results += f"### Step {step_number}:\n"
-            formatted_results += f"{thought}\n\n"
-        
-        formatted_results += "### Conclusion:\n"
-        formatted_results += f"{conclusion}\n"
+        parts = ["## Sequential Thinking Analysis\n\n"]
+        parts.extend(
+            f"### Step {step.get('step_number', '?')}:\n"
+            f"{step.get('thought', 'No thought provided.')}\n\n"
+            for step in steps
+        )
+        parts.append(f"### Conclusion:\n{conclusion}\n")
         
-        return formatted_results 
\ No newline at end of file
+        return "".join(parts) 
\ No newline at end of file
@@ -1,8 +1,19 @@
 import os
-from typing import Dict, List, Any, Optional, Union
-import json
+import sys
+import asyncio
+import heapq
+import itertools
+import queue
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Union
 from pathlib import Path
 
+import orjson
+
 from src.agents.requirementer_agent import RequirementerAgent
 from src.agents.tasker_agent import TaskerAgent
 from src.agents.goaler_agent import GoalerAgent
@@ -10,10 +21,58 @@ from src.agents.coder_agent import CoderAgent
 from src.agents.qualitator_agent import QualitatorAgent
 from src.agents.communicator_agent import CommunicatorAgent
 from src.utils.logging_utils import setup_logger
-from src.config.config import MODEL_CONFIGS, DEFAULT_MODEL, DATA_DIR
+from src.utils.llm_cache import cached_run
+from src.utils.aio import read_many, read_many_blocking
+from src.utils.llm_pool import LLMClientPool
+from src.config.config import MODEL_CONFIGS, DEFAULT_MODEL, DATA_DIR, config
 
 logger = setup_logger(__name__)
 
+@lru_cache(maxsize=8)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a text file, memoized on its stat so an edited file is read again.
+    
+    Args:
+        path (str): Path to the file
+        mtime_ns (int): The file's modification time in nanoseconds
+        size (int): The file's size in bytes
+        
+    Returns:
+        str: The file content
+    """
+    with open(path, 'r') as f:
+        return f.read()
+
+@lru_cache(maxsize=8)
+def _read_bytes_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a file's bytes, memoized on its stat so an edited file is read again.
+    
+    Args:
+        path (str): Path to the file
+        mtime_ns (int): The file's modification time in nanoseconds
+        size (int): The file's size in bytes
+        
+    Returns:
+        bytes: The file content
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Slotted dataclasses need Python 3.10+
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
+class ManagerState:
+    """State of the agent pipeline tracked by the AgentManager."""
+    current_stage: str = "initialization"
+    prd_created: bool = False
+    goal_graph_created: bool = False
+    goal_graph_approved: bool = False
+    tasks_assigned: Dict[str, str] = field(default_factory=dict)  # task_id -> agent_id
+    tasks_completed: Dict[str, str] = field(default_factory=dict)  # task_id -> status
+    files_modified: Set[str] = field(default_factory=set)  # file paths
+    agents_created: Dict[str, str] = field(default_factory=dict)  # agent_type -> agent_id
+
 class AgentManager:
     """
     Manages the creation and coordination of all specialized agents.
@@ -36,16 +95,7 @@ class AgentManager:
         os.makedirs(self.goal_graph_dir, exist_ok=True)
         
         # Initialize state
-        self.state = {
-            "current_stage": "initialization",
-            "prd_created": False,
-            "goal_graph_created": False,
-            "goal_graph_approved": False,
-            "tasks_assigned": {},  # dict of task_id -> agent_id
-            "tasks_completed": {},  # dict of task_id -> status
-            "files_modified": set(),  # set of file paths
-            "agents_created": {},  # dict of agent_type -> agent_id
-        }
+        self.state = ManagerState()
         
         # Will be initialized later
         self.requirementer_agent = None
@@ -55,13 +105,31 @@ class AgentManager:
         self.qualitator_agent = None
         self.communicator_agent = None
         
+        # Agents that share a model share its LLM client
+        self._llm_pool = LLMClientPool()
+        
+        # Lookup tables for tasks and Coder agents by ID
+        self._task_by_id: Dict[str, Dict[str, Any]] = {}
+        self._coder_by_id: Dict[str, CoderAgent] = {}
+        
+        # Dependency tracking for assign_tasks: unmet dependency counts, dependents
+        # of each task, and a heap of tasks whose dependencies are all completed
+        self._indegree: Dict[str, int] = {}
+        self._dependents: Dict[str, List[str]] = defaultdict(list)
+        self._ready: List[Tuple[int, int, str]] = []
+        
+        # Disk writes are handed to a single background thread, which keeps them in order
+        self._io_queue: "queue.Queue[Optional[Tuple[Callable[..., None], tuple]]]" = queue.Queue()
+        self._io_thread: Optional[threading.Thread] = None
+        
         # Load the latest PRD and Goal Graph if they exist
         self.prd = self._load_latest_prd()
         self.goal_graph = self._load_latest_goal_graph()
+        self._index_goal_graph()
         
         # Update state based on loaded data
-        self.state["prd_created"] = self.prd is not None
-        self.state["goal_graph_created"] = self.goal_graph is not None
+        self.state.prd_created = self.prd is not None
+        self.state.goal_graph_created = self.goal_graph is not None
     
     def create_agents(self, 
                       requirementer_model: str = DEFAULT_MODEL,
@@ -85,26 +153,36 @@ class AgentManager:
         """
         logger.info(f"Creating specialized agents...")
         
+        # Look up each distinct model's settings once
+        model_configs = {
+            model: MODEL_CONFIGS.get(model, {})
+            for model in {requirementer_model, tasker_model, goaler_model,
+                          coder_model, qualitator_model, communicator_model}
+        }
+        
         # Create the Requirementer agent
         self.requirementer_agent = RequirementerAgent(
             llm=requirementer_model,
-            **MODEL_CONFIGS.get(requirementer_model, {})
+            client=self._llm_client(requirementer_model, model_configs[requirementer_model]),
+            model_config=model_configs[requirementer_model]
         )
-        self.state["agents_created"]["requirementer"] = self.requirementer_agent.id
+        self.state.agents_created["requirementer"] = self.requirementer_agent.id
         
         # Create the Tasker agent
         self.tasker_agent = TaskerAgent(
             llm=tasker_model,
-            **MODEL_CONFIGS.get(tasker_model, {})
+            client=self._llm_client(tasker_model, model_configs[tasker_model]),
+            model_config=model_configs[tasker_model]
         )
-        self.state["agents_created"]["tasker"] = self.tasker_agent.id
+        self.state.agents_created["tasker"] = self.tasker_agent.id
         
         # Create the Goaler agent
         self.goaler_agent = GoalerAgent(
             llm=goaler_model,
-            **MODEL_CONFIGS.get(goaler_model, {})
+            client=self._llm_client(goaler_model, model_configs[goaler_model]),
+            model_config=model_configs[goaler_model]
         )
-        self.state["agents_created"]["goaler"] = self.goaler_agent.id
+        self.state.agents_created["goaler"] = self.goaler_agent.id
         
         # Create the Coder agents
         self.coder_agents = []
@@ -112,27 +190,45 @@ class AgentManager:
             coder_agent = CoderAgent(
                 team_id="coder_team",
                 llm=coder_model,
-                **MODEL_CONFIGS.get(coder_model, {})
+                client=self._llm_client(coder_model, model_configs[coder_model]),
+                model_config=model_configs[coder_model]
             )
             self.coder_agents.append(coder_agent)
-            self.state["agents_created"][f"coder_{i+1}"] = coder_agent.id
+            self.state.agents_created[f"coder_{i+1}"] = coder_agent.id
+        self._coder_by_id = {agent.id: agent for agent in self.coder_agents}
         
         # Create the Qualitator agent
         self.qualitator_agent = QualitatorAgent(
             llm=qualitator_model,
-            **MODEL_CONFIGS.get(qualitator_model, {})
+            client=self._llm_client(qualitator_model, model_configs[qualitator_model]),
+            model_config=model_configs[qualitator_model]
         )
-        self.state["agents_created"]["qualitator"] = self.qualitator_agent.id
+        self.state.agents_created["qualitator"] = self.qualitator_agent.id
         
         # Create the Communicator agent
         self.communicator_agent = CommunicatorAgent(
             llm=communicator_model,
-            **MODEL_CONFIGS.get(communicator_model, {})
+            client=self._llm_client(communicator_model, model_configs[communicator_model]),
+            model_config=model_configs[communicator_model]
         )
-        self.state["agents_created"]["communicator"] = self.communicator_agent.id
+        self.state.agents_created["communicator"] = self.communicator_agent.id
         
         logger.info(f"Created all specialized agents successfully")
     
+    def _llm_client(self, model: str, model_config: Dict[str, Any]) -> Any:
+        """
+        Get the pooled LLM client for a model, using its configured sampling settings.
+        
+        Args:
+            model (str): Name of the model
+            model_config (Dict[str, Any]): The model's settings from MODEL_CONFIGS
+            
+        Returns:
+            LLM: The shared client
+        """
+        settings = {key: model_config[key] for key in ("temperature", "max_tokens") if key in model_config}
+        return self._llm_pool.get(model, **settings)
+    
     def generate_prd(self, user_request: str) -> str:
         """
         Generate a Product Requirement Document from the user request.
@@ -150,17 +246,17 @@ class AgentManager:
             raise ValueError("Requirementer agent is not initialized. Call create_agents() first.")
         
         # Update state
-        self.state["current_stage"] = "generating_prd"
+        self.state.current_stage = "generating_prd"
         
         # Generate the PRD
-        self.prd = self.requirementer_agent.run(user_request)
+        self.prd = cached_run(self.requirementer_agent, user_request, namespace="prd")
         
         # Save the PRD
         self._save_prd(self.prd)
         
         # Update state
-        self.state["prd_created"] = True
-        self.state["current_stage"] = "prd_generated"
+        self.state.prd_created = True
+        self.state.current_stage = "prd_generated"
         
         logger.info(f"Generated PRD successfully")
         return self.prd
@@ -186,16 +282,19 @@ class AgentManager:
             raise ValueError("No PRD exists. Call generate_prd() first.")
         
         # Update state
-        self.state["current_stage"] = "refining_prd"
+        self.state.current_stage = "refining_prd"
         
         # Refine the PRD
-        self.prd = self.requirementer_agent.refine_requirements(self.prd, additional_input)
+        self.prd = cached_run(
+            self.requirementer_agent, self.prd, additional_input,
+            namespace="prd", method="refine_requirements"
+        )
         
         # Save the PRD
         self._save_prd(self.prd)
         
         # Update state
-        self.state["current_stage"] = "prd_refined"
+        self.state.current_stage = "prd_refined"
         
         logger.info(f"Refined PRD successfully")
         return self.prd
@@ -218,14 +317,15 @@ class AgentManager:
             raise ValueError("No PRD exists. Call generate_prd() first.")
         
         # Update state
-        self.state["current_stage"] = "creating_goal_graph"
+        self.state.current_stage = "creating_goal_graph"
         
         # Create the Goal Graph
         self.goal_graph = self.tasker_agent.run(self.prd)
+        self._index_goal_graph()
         
         # Update state
-        self.state["goal_graph_created"] = True
-        self.state["current_stage"] = "goal_graph_created"
+        self.state.goal_graph_created = True
+        self.state.current_stage = "goal_graph_created"
         
         logger.info(f"Created Goal Graph successfully with {len(self.goal_graph.get('tasks', []))} tasks")
         return self.goal_graph
@@ -250,17 +350,17 @@ class AgentManager:
             raise ValueError("No Goal Graph exists. Call create_goal_graph() first.")
         
         # Update state
-        self.state["current_stage"] = "validating_goal_graph"
+        self.state.current_stage = "validating_goal_graph"
         
         # Validate the Goal Graph
-        validation_results = self.goaler_agent.run(self.prd, self.goal_graph)
+        validation_results = cached_run(self.goaler_agent, self.prd, self.goal_graph, namespace="goal_graph_validation")
         
         # Update state
-        self.state["current_stage"] = "goal_graph_validated"
+        self.state.current_stage = "goal_graph_validated"
         
         # If approved, update the approval status
         if validation_results.get("approved", False):
-            self.state["goal_graph_approved"] = True
+            self.state.goal_graph_approved = True
         
         logger.info(f"Validated Goal Graph with approval status: {validation_results.get('approved', False)}")
         return validation_results
@@ -290,32 +390,34 @@ class AgentManager:
         feedback = validation_results.get("feedback", [])
         
         # Format the updates as a string
-        updates = "Updates needed:\n\n"
+        parts = ["Updates needed:\n\n"]
         
         # Add issues
         if issues:
-            updates += "Issues to address:\n"
+            parts.append("Issues to address:\n")
             for i, issue in enumerate(issues, 1):
                 issue_type = issue.get("type", "unknown")
                 description = issue.get("description", "No description provided")
-                updates += f"{i}. Issue ({issue_type}): {description}\n"
-            updates += "\n"
+                parts.append(f"{i}. Issue ({issue_type}): {description}\n")
+            parts.append("\n")
         
         # Add feedback
         if feedback:
-            updates += "Feedback to incorporate:\n"
-            for i, item in enumerate(feedback, 1):
-                updates += f"{i}. {item}\n"
-            updates += "\n"
+            parts.append("Feedback to incorporate:\n")
+            parts.extend(f"{i}. {item}\n" for i, item in enumerate(feedback, 1))
+            parts.append("\n")
+        
+        updates = "".join(parts)
         
         # Update state
-        self.state["current_stage"] = "updating_goal_graph"
+        self.state.current_stage = "updating_goal_graph"
         
         # Update the Goal Graph
         self.goal_graph = self.tasker_agent.update_goal_graph(self.goal_graph, updates)
+        self._index_goal_graph()
         
         # Update state
-        self.state["current_stage"] = "goal_graph_updated"
+        self.state.current_stage = "goal_graph_updated"
         
         logger.info(f"Updated Goal Graph successfully with {len(self.goal_graph.get('tasks', []))} tasks")
         return self.goal_graph
@@ -338,21 +440,48 @@ class AgentManager:
             raise ValueError("No Goal Graph exists. Call create_goal_graph() first.")
         
         # Update state
-        self.state["current_stage"] = "approving_goal_graph"
+        self.state.current_stage = "approving_goal_graph"
         
         # Approve the Goal Graph
-        approval_doc = self.goaler_agent.approve_goal_graph(self.goal_graph)
+        approval_doc = cached_run(
+            self.goaler_agent, self.goal_graph, self.prd,
+            namespace="goal_graph_approval", method="approve_goal_graph"
+        )
         
         # Update state
         if approval_doc.get("approved", False):
-            self.state["goal_graph_approved"] = True
-            self.state["current_stage"] = "goal_graph_approved"
+            self.state.goal_graph_approved = True
+            self.state.current_stage = "goal_graph_approved"
         else:
-            self.state["current_stage"] = "goal_graph_approval_failed"
+            self.state.current_stage = "goal_graph_approval_failed"
         
         logger.info(f"Goal Graph approval status: {approval_doc.get('approved', False)}")
         return approval_doc
     
+    def reconcile_goal_graph(self) -> Dict[str, Any]:
+        """
+        Validate, update if needed, and approve the Goal Graph in one pass.
+        
+        Validation and approval prompts share their leading PRD and Goal Graph context,
+        so when no update is needed the approval call reuses the model server's cached prefix.
+        
+        Returns:
+            Dict[str, Any]: The validation results, whether the graph was updated, and the approval document
+        """
+        validation_results = self.validate_goal_graph()
+        
+        updated = bool(validation_results.get("issues") or validation_results.get("feedback"))
+        if updated:
+            self.update_goal_graph(validation_results)
+        
+        approval_doc = self.approve_goal_graph()
+        
+        return {
+            "validation": validation_results,
+            "updated": updated,
+            "approval": approval_doc,
+        }
+    
     def assign_tasks(self) -> Dict[str, List[str]]:
         """
         Assign tasks from the Goal Graph to Coder agents.
@@ -369,57 +498,37 @@ class AgentManager:
         # Check if Goal Graph exists and is approved
         if self.goal_graph is None:
             raise ValueError("No Goal Graph exists. Call create_goal_graph() first.")
-        if not self.state.get("goal_graph_approved", False):
+        if not self.state.goal_graph_approved:
             raise ValueError("Goal Graph is not approved. Call approve_goal_graph() first.")
         
-        # Get the tasks from the Goal Graph
-        tasks = self.goal_graph.get("tasks", [])
-        
-        # Filter for tasks that are not assigned and don't have dependencies
-        # or all dependencies are completed
+        # Pop the tasks whose dependencies are all completed, highest priority first. Each agent
+        # takes at most agents.max_concurrent_tasks per round; the rest stay ready for the next call.
+        limit = len(self.coder_agents) * config.get('agents.max_concurrent_tasks', 2)
         available_tasks = []
-        for task in tasks:
-            task_id = task.get("id")
-            status = task.get("status", "Not Started")
-            dependencies = task.get("dependencies", [])
+        while self._ready and len(available_tasks) < limit:
+            _, _, task_key = heapq.heappop(self._ready)
+            task = self._task_by_id[task_key]
             
             # Skip if already assigned or completed
-            if task_id in self.state["tasks_assigned"] or status == "Completed":
+            if task.get("id") in self.state.tasks_assigned or task.get("status") == "Completed":
                 continue
-            
-            # Check if all dependencies are completed
-            all_deps_completed = True
-            for dep_id in dependencies:
-                dep_status = self.state["tasks_completed"].get(dep_id)
-                if dep_status != "Completed":
-                    all_deps_completed = False
-                    break
-            
-            # If no dependencies or all dependencies are completed, add to available tasks
-            if not dependencies or all_deps_completed:
-                available_tasks.append(task)
-        
-        # Sort available tasks by priority
-        priority_map = {"High": 3, "Medium": 2, "Low": 1}
-        available_tasks.sort(key=lambda t: (priority_map.get(t.get("priority", "Medium"), 0), -len(t.get("dependencies", []))))
+            available_tasks.append(task)
         
         # Initialize assignment dictionary
         assignments = {agent.id: [] for agent in self.coder_agents}
         
         # Assign tasks to agents (simple round-robin for now)
-        for i, task in enumerate(available_tasks):
-            agent_idx = i % len(self.coder_agents)
-            agent_id = self.coder_agents[agent_idx].id
+        for agent_id, task in zip(itertools.cycle(assignments), available_tasks):
             task_id = task.get("id")
             
             # Assign task
             assignments[agent_id].append(task_id)
-            self.state["tasks_assigned"][task_id] = agent_id
+            self.state.tasks_assigned[task_id] = agent_id
             task["owner"] = agent_id
             task["status"] = "In Progress"
         
         # Update state
-        self.state["current_stage"] = "tasks_assigned"
+        self.state.current_stage = "tasks_assigned"
         
         logger.info(f"Assigned {len(available_tasks)} tasks to {len(self.coder_agents)} Coder agents")
         return assignments
@@ -437,48 +546,159 @@ class AgentManager:
         """
         logger.info(f"Implementing task {task_id}...")
         
+        agent, task = self._get_implementation_target(task_id)
+        
+        # Update state
+        self.state.current_stage = f"implementing_task_{task_id}"
+        
+        # Implement the task
+        file_contents = read_many_blocking(file_access, config.get('tools.max_file_bytes', 64 * 1024))
+        implementation_results = agent.run(task, file_access, file_contents)
+        
+        self._record_implementation(task_id, task, implementation_results)
+        return implementation_results
+    
+    async def implement_assigned_batch(self, file_access_map: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Implement all assigned tasks concurrently, in dependency order.
+        
+        Tasks run in waves: each wave holds every pending task whose dependencies
+        are completed or were implemented in an earlier wave. Tasks in a wave run
+        concurrently, except that tasks owned by the same Coder agent run one at a time.
+        
+        Args:
+            file_access_map (Dict[str, List[str]]): Paths each task's agent can access, keyed by task ID
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Implementation results keyed by task ID
+        """
+        pending = [task_id for task_id in self.state.tasks_assigned
+                   if task_id not in self.state.tasks_completed]
+        logger.info(f"Implementing {len(pending)} assigned tasks concurrently...")
+        
+        # A Coder agent tracks its current task and locked files, so it can only run one task at a time
+        agent_locks = {agent.id: asyncio.Lock() for agent in self.coder_agents}
+        
+        implemented = set()
+        results = {}
+        
+        while pending:
+            wave = [
+                task_id for task_id in pending
+                if all(dep_id in implemented or self.state.tasks_completed.get(dep_id) == "Completed"
+                       for dep_id in self._task_by_id.get(str(task_id), {}).get("dependencies", []))
+            ]
+            if not wave:
+                logger.warning(f"Could not schedule {len(pending)} tasks, their dependencies are not implemented")
+                break
+            
+            wave_results = await asyncio.gather(
+                *(self._implement_one(task_id, file_access_map.get(task_id, []), agent_locks) for task_id in wave),
+                return_exceptions=True
+            )
+            
+            for task_id, result in zip(wave, wave_results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error implementing task {task_id}: {result}")
+                    results[task_id] = {"status": "error", "message": str(result)}
+                else:
+                    results[task_id] = result
+                    implemented.add(task_id)
+            
+            # Failed tasks are dropped so their dependents stay unscheduled
+            pending = [task_id for task_id in pending if task_id not in wave]
+        
+        logger.info(f"Implemented {len(implemented)} tasks")
+        return results
+    
+    async def _implement_one(self, task_id: str, file_access: List[str],
+                             agent_locks: Dict[str, asyncio.Lock]) -> Dict[str, Any]:
+        """
+        Implement a single task on a worker thread.
+        
+        Args:
+            task_id (str): ID of the task to implement
+            file_access (List[str]): Paths to files the agent can access
+            agent_locks (Dict[str, asyncio.Lock]): Per-agent locks serializing each agent's tasks
+            
+        Returns:
+            Dict[str, Any]: Implementation results
+        """
+        agent, task = self._get_implementation_target(task_id)
+        
+        async with agent_locks[agent.id]:
+            self.state.current_stage = f"implementing_task_{task_id}"
+            # Read inside the lock so an earlier task by this agent has finished writing
+            file_contents = await read_many(file_access, config.get('tools.max_file_bytes', 64 * 1024))
+            implementation_results = await asyncio.to_thread(agent.run, task, file_access, file_contents)
+        
+        # State is only updated here, on the event loop thread, so concurrent tasks never interleave
+        self._record_implementation(task_id, task, implementation_results)
+        return implementation_results
+    
+    def _get_implementation_target(self, task_id: str) -> Tuple[CoderAgent, Dict[str, Any]]:
+        """
+        Look up the Coder agent assigned to a task and the task itself.
+        
+        Args:
+            task_id (str): ID of the task
+            
+        Returns:
+            Tuple[CoderAgent, Dict[str, Any]]: The assigned agent and the task from the Goal Graph
+        """
         # Check if the task is assigned
-        if task_id not in self.state["tasks_assigned"]:
+        if task_id not in self.state.tasks_assigned:
             raise ValueError(f"Task {task_id} is not assigned. Call assign_tasks() first.")
         
         # Get the assigned agent
-        agent_id = self.state["tasks_assigned"][task_id]
-        agent = None
-        for coder in self.coder_agents:
-            if coder.id == agent_id:
-                agent = coder
-                break
+        agent_id = self.state.tasks_assigned[task_id]
+        agent = self._coder_by_id.get(agent_id)
         
         if agent is None:
             raise ValueError(f"No Coder agent found with ID {agent_id}")
         
         # Get the task from the Goal Graph
-        task = None
-        for t in self.goal_graph.get("tasks", []):
-            if str(t.get("id")) == str(task_id):
-                task = t
-                break
+        task = self._task_by_id.get(str(task_id))
         
         if task is None:
             raise ValueError(f"No task found with ID {task_id} in the Goal Graph")
         
-        # Update state
-        self.state["current_stage"] = f"implementing_task_{task_id}"
-        
-        # Implement the task
-        implementation_results = agent.run(task, file_access)
+        return agent, task
+    
+    def _record_implementation(self, task_id: str, task: Dict[str, Any],
+                               implementation_results: Dict[str, Any]) -> None:
+        """
+        Record the outcome of a task implementation in the system state.
         
+        Args:
+            task_id (str): ID of the implemented task
+            task (Dict[str, Any]): The task from the Goal Graph
+            implementation_results (Dict[str, Any]): Results from the implementation
+        """
         # Update modified files
-        modified_files = implementation_results.get("files_modified", [])
-        self.state["files_modified"].update(modified_files)
+        self._record_modified_files(implementation_results.get("files_modified", []))
         
         # Update state
-        self.state["tasks_completed"][task_id] = "Needs Review"
+        self.state.tasks_completed[task_id] = "Needs Review"
         task["status"] = "Needs Review"
-        self.state["current_stage"] = f"task_{task_id}_implemented"
+        self.state.current_stage = f"task_{task_id}_implemented"
         
         logger.info(f"Implemented task {task_id} with status: {implementation_results.get('status', 'unknown')}")
-        return implementation_results
+    
+    def _record_modified_files(self, modified_files: List[Any]) -> None:
+        """
+        Add reported file paths to state.files_modified.
+        
+        Paths are normalized so one file reported as "./src/a.py" and "src/a.py" is stored once,
+        and interned so the set shares the strings used elsewhere. Entries that are not strings
+        (agents report these as free-form JSON) are skipped.
+        
+        Args:
+            modified_files (List[Any]): Paths reported by an agent
+        """
+        self.state.files_modified.update(
+            sys.intern(os.path.normpath(path)) for path in modified_files if isinstance(path, str) and path
+        )
     
     def review_task(self, task_id: str, implementation_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -498,15 +718,11 @@ class AgentManager:
             raise ValueError("Qualitator agent is not initialized. Call create_agents() first.")
         
         # Check if the task is completed
-        if self.state["tasks_completed"].get(task_id) != "Needs Review":
+        if self.state.tasks_completed.get(task_id) != "Needs Review":
             raise ValueError(f"Task {task_id} is not ready for review.")
         
         # Get the task from the Goal Graph
-        task = None
-        for t in self.goal_graph.get("tasks", []):
-            if str(t.get("id")) == str(task_id):
-                task = t
-                break
+        task = self._task_by_id.get(str(task_id))
         
         if task is None:
             raise ValueError(f"No task found with ID {task_id} in the Goal Graph")
@@ -515,20 +731,21 @@ class AgentManager:
         task_files = implementation_results.get("files_modified", [])
         
         # Update state
-        self.state["current_stage"] = f"reviewing_task_{task_id}"
+        self.state.current_stage = f"reviewing_task_{task_id}"
         
         # Review the task
         review_results = self.qualitator_agent.run(task, implementation_results, task_files)
         
         # Update state based on review results
         if review_results.get("approved", False):
-            self.state["tasks_completed"][task_id] = "Completed"
+            self.state.tasks_completed[task_id] = "Completed"
             task["status"] = "Completed"
-            self.state["current_stage"] = f"task_{task_id}_completed"
+            self._release_dependents(task_id)
+            self.state.current_stage = f"task_{task_id}_completed"
         else:
-            self.state["tasks_completed"][task_id] = "Needs Fixes"
+            self.state.tasks_completed[task_id] = "Needs Fixes"
             task["status"] = "Needs Fixes"
-            self.state["current_stage"] = f"task_{task_id}_needs_fixes"
+            self.state.current_stage = f"task_{task_id}_needs_fixes"
         
         logger.info(f"Reviewed task {task_id} with approval status: {review_results.get('approved', False)}")
         return review_results
@@ -548,16 +765,12 @@ class AgentManager:
         logger.info(f"Fixing task {task_id}...")
         
         # Check if the task needs fixes
-        if self.state["tasks_completed"].get(task_id) != "Needs Fixes":
+        if self.state.tasks_completed.get(task_id) != "Needs Fixes":
             raise ValueError(f"Task {task_id} does not need fixes.")
         
         # Get the assigned agent
-        agent_id = self.state["tasks_assigned"][task_id]
-        agent = None
-        for coder in self.coder_agents:
-            if coder.id == agent_id:
-                agent = coder
-                break
+        agent_id = self.state.tasks_assigned[task_id]
+        agent = self._coder_by_id.get(agent_id)
         
         if agent is None:
             raise ValueError(f"No Coder agent found with ID {agent_id}")
@@ -566,25 +779,24 @@ class AgentManager:
         issues = review_results.get("issues", [])
         
         # Update state
-        self.state["current_stage"] = f"fixing_task_{task_id}"
+        self.state.current_stage = f"fixing_task_{task_id}"
         
         # Fix the issues
-        fix_results = agent.fix_issues(issues, file_access)
+        file_contents = read_many_blocking(file_access, config.get('tools.max_file_bytes', 64 * 1024))
+        fix_results = agent.fix_issues(issues, file_access, file_contents)
         
         # Update modified files
-        modified_files = fix_results.get("files_modified", [])
-        self.state["files_modified"].update(modified_files)
+        self._record_modified_files(fix_results.get("files_modified", []))
         
         # Update state
-        self.state["tasks_completed"][task_id] = "Needs Review"
+        self.state.tasks_completed[task_id] = "Needs Review"
         
         # Get the task from the Goal Graph and update its status
-        for t in self.goal_graph.get("tasks", []):
-            if str(t.get("id")) == str(task_id):
-                t["status"] = "Needs Review"
-                break
+        task = self._task_by_id.get(str(task_id))
+        if task is not None:
+            task["status"] = "Needs Review"
         
-        self.state["current_stage"] = f"task_{task_id}_fixes_implemented"
+        self.state.current_stage = f"task_{task_id}_fixes_implemented"
         
         logger.info(f"Fixed task {task_id} with {len(fix_results.get('fixed_issues', []))} issues fixed")
         return fix_results
@@ -608,15 +820,11 @@ class AgentManager:
             raise ValueError("Qualitator agent is not initialized. Call create_agents() first.")
         
         # Check if the task is ready for verification
-        if self.state["tasks_completed"].get(task_id) != "Needs Review":
+        if self.state.tasks_completed.get(task_id) != "Needs Review":
             raise ValueError(f"Task {task_id} is not ready for verification.")
         
         # Get the task from the Goal Graph
-        task = None
-        for t in self.goal_graph.get("tasks", []):
-            if str(t.get("id")) == str(task_id):
-                task = t
-                break
+        task = self._task_by_id.get(str(task_id))
         
         if task is None:
             raise ValueError(f"No task found with ID {task_id} in the Goal Graph")
@@ -628,20 +836,21 @@ class AgentManager:
         task_files = fix_results.get("files_modified", [])
         
         # Update state
-        self.state["current_stage"] = f"verifying_fixes_for_task_{task_id}"
+        self.state.current_stage = f"verifying_fixes_for_task_{task_id}"
         
         # Verify the fixes
         verification_results = self.qualitator_agent.verify_fix(task, issues, fix_results, task_files)
         
         # Update state based on verification results
         if verification_results.get("all_fixed", False):
-            self.state["tasks_completed"][task_id] = "Completed"
+            self.state.tasks_completed[task_id] = "Completed"
             task["status"] = "Completed"
-            self.state["current_stage"] = f"task_{task_id}_completed"
+            self._release_dependents(task_id)
+            self.state.current_stage = f"task_{task_id}_completed"
         else:
-            self.state["tasks_completed"][task_id] = "Needs Fixes"
+            self.state.tasks_completed[task_id] = "Needs Fixes"
             task["status"] = "Needs Fixes"
-            self.state["current_stage"] = f"task_{task_id}_needs_fixes"
+            self.state.current_stage = f"task_{task_id}_needs_fixes"
         
         logger.info(f"Verified fixes for task {task_id} with all fixed status: {verification_results.get('all_fixed', False)}")
         return verification_results
@@ -665,32 +874,33 @@ class AgentManager:
         
         # Create project summary information
         project_name = "Falcon Agent"
+        prd = self.prd or ""
         project_summary = {
             "name": project_name,
             "description": "A multi-agent system for autonomous software development",
             "version": "1.0.0",
             "status": "Completed",
-            "prd_summary": self.prd[:1000] + "..." if len(self.prd) > 1000 else self.prd,
+            "prd_summary": prd[:1000] + "..." if len(prd) > 1000 else prd,
         }
         
         # Get completed tasks from the Goal Graph
-        completed_tasks = []
-        for task in self.goal_graph.get("tasks", []):
-            task_id = task.get("id")
-            if self.state["tasks_completed"].get(task_id) == "Completed":
-                completed_tasks.append(task)
+        completed_ids = {str(task_id) for task_id, status in self.state.tasks_completed.items()
+                         if status == "Completed"}
+        completed_tasks = [task for task in self.goal_graph.get("tasks", ()) if str(task.get("id")) in completed_ids]
         
-        # Convert files_modified set to list
-        files_changed = list(self.state["files_modified"])
+        # Sort files_modified so the summary request is deterministic
+        files_changed = sorted(self.state.files_modified)
         
         # Update state
-        self.state["current_stage"] = "creating_project_summary"
+        self.state.current_stage = "creating_project_summary"
         
         # Create the project summary
-        summary = self.communicator_agent.run(project_summary, completed_tasks, files_changed)
+        summary = cached_run(
+            self.communicator_agent, project_summary, completed_tasks, files_changed, namespace="project_summary"
+        )
         
         # Update state
-        self.state["current_stage"] = "project_summary_created"
+        self.state.current_stage = "project_summary_created"
         
         logger.info(f"Created project summary: {len(summary)} characters")
         return summary
@@ -702,27 +912,86 @@ class AgentManager:
         Args:
             prd (str): The PRD to save
         """
-        timestamp = int(os.path.getmtime(self.prd_dir)) if os.path.exists(self.prd_dir) else 0
+        self._submit_write(self._write_prd, prd, time.time_ns())
+    
+    def _write_prd(self, prd: str, timestamp: int) -> None:
+        """
+        Write a PRD to its timestamped file and to latest.md. Runs on the writer thread.
+        
+        Args:
+            prd (str): The PRD to save
+            timestamp (int): Nanosecond timestamp taken when the save was requested
+        """
         filename = f"prd_{timestamp}.md"
         file_path = self.prd_dir / filename
         
         # Also save as latest
         latest_path = self.prd_dir / "latest.md"
         
+        tmp_path = self.prd_dir / f".prd_{timestamp}.tmp"
+        latest_tmp_path = self.prd_dir / f".latest_{timestamp}.tmp"
+        
         try:
-            # Save the timestamped version
-            with open(file_path, 'w') as f:
+            # Write the PRD once, then rename it into place so readers never see a partial file
+            with open(tmp_path, 'w') as f:
                 f.write(prd)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
             
-            # Save as latest
-            with open(latest_path, 'w') as f:
-                f.write(prd)
+            # Point latest at the same file; both names are only ever replaced, never rewritten
+            try:
+                os.link(file_path, latest_tmp_path)
+            except OSError:
+                # Filesystem without hard links
+                with open(latest_tmp_path, 'w') as f:
+                    f.write(prd)
+            os.replace(latest_tmp_path, latest_path)
             
             logger.info(f"PRD saved to {file_path} and {latest_path}")
             
         except Exception as e:
             logger.error(f"Error saving PRD: {e}")
     
+    def _submit_write(self, func: Callable[..., None], *args: Any) -> None:
+        """
+        Queue a disk write for the background writer thread, starting it on first use.
+        
+        Args:
+            func (Callable[..., None]): The function performing the write
+            *args: Arguments to pass to the function
+        """
+        if self._io_thread is None or not self._io_thread.is_alive():
+            self._io_thread = threading.Thread(target=self._io_writer, name="agent-manager-writer", daemon=True)
+            self._io_thread.start()
+        self._io_queue.put((func, args))
+    
+    def _io_writer(self) -> None:
+        """Run queued disk writes until a None sentinel is received."""
+        while True:
+            item = self._io_queue.get()
+            try:
+                if item is None:
+                    return
+                func, args = item
+                func(*args)
+            except Exception as e:
+                logger.error(f"Error in background write: {e}")
+            finally:
+                self._io_queue.task_done()
+    
+    def flush_writes(self) -> None:
+        """Block until all queued disk writes have completed."""
+        self._io_queue.join()
+    
+    async def aclose(self) -> None:
+        """Wait for queued disk writes to complete and stop the writer thread."""
+        await asyncio.to_thread(self.flush_writes)
+        if self._io_thread is not None and self._io_thread.is_alive():
+            self._io_queue.put(None)
+            await asyncio.to_thread(self._io_thread.join)
+        self._io_thread = None
+    
     def _load_latest_prd(self) -> Optional[str]:
         """
         Load the latest PRD from disk.
@@ -732,18 +1001,65 @@ class AgentManager:
         """
         latest_path = self.prd_dir / "latest.md"
         
-        if not os.path.exists(latest_path):
+        try:
+            st = os.stat(latest_path)
+        except FileNotFoundError:
             logger.warning(f"No PRD found at {latest_path}")
             return None
         
         try:
-            with open(latest_path, 'r') as f:
-                return f.read()
+            return _read_text_cached(str(latest_path), st.st_mtime_ns, st.st_size)
                 
         except Exception as e:
             logger.error(f"Error loading PRD: {e}")
             return None
     
+    def _index_goal_graph(self) -> None:
+        """Rebuild the task lookup table and dependency tracking from the current Goal Graph."""
+        tasks = self.goal_graph.get("tasks", []) if self.goal_graph else []
+        self._task_by_id = {str(task.get("id")): task for task in tasks}
+        
+        completed = {str(task_id) for task_id, status in self.state.tasks_completed.items()
+                     if status == "Completed"}
+        
+        self._indegree = {}
+        self._dependents = defaultdict(list)
+        self._ready = []
+        for task_key, task in self._task_by_id.items():
+            pending_deps = [str(dep_id) for dep_id in task.get("dependencies", [])
+                            if str(dep_id) not in completed]
+            self._indegree[task_key] = len(pending_deps)
+            for dep_key in pending_deps:
+                self._dependents[dep_key].append(task_key)
+            if not pending_deps:
+                self._push_ready(task_key)
+    
+    def _push_ready(self, task_key: str) -> None:
+        """
+        Add a task to the ready heap.
+        
+        Args:
+            task_key (str): ID of the task, as a string
+        """
+        task = self._task_by_id[task_key]
+        priority_map = {"High": 3, "Medium": 2, "Low": 1}
+        priority = priority_map.get(task.get("priority", "Medium"), 0)
+        heapq.heappush(self._ready, (-priority, -len(task.get("dependencies", [])), task_key))
+    
+    def _release_dependents(self, task_id: str) -> None:
+        """
+        Mark a task's dependents as having one fewer unmet dependency.
+        
+        Dependents left with no unmet dependencies become ready for assignment.
+        
+        Args:
+            task_id (str): ID of the completed task
+        """
+        for dependent_key in self._dependents.pop(str(task_id), []):
+            self._indegree[dependent_key] -= 1
+            if self._indegree[dependent_key] == 0:
+                self._push_ready(dependent_key)
+    
     def _load_latest_goal_graph(self) -> Optional[Dict[str, Any]]:
         """
         Load the latest Goal Graph from disk.
@@ -753,13 +1069,15 @@ class AgentManager:
         """
         latest_path = self.goal_graph_dir / "latest.json"
         
-        if not os.path.exists(latest_path):
+        try:
+            st = os.stat(latest_path)
+        except FileNotFoundError:
             logger.warning(f"No Goal Graph found at {latest_path}")
             return None
         
         try:
-            with open(latest_path, 'r') as f:
-                return json.load(f)
+            # Only the bytes are memoized; each manager parses its own copy because tasks are mutated in place
+            return orjson.loads(_read_bytes_cached(str(latest_path), st.st_mtime_ns, st.st_size))
                 
         except Exception as e:
             logger.error(f"Error loading Goal Graph: {e}")
@@ -7,55 +7,206 @@ agent capabilities.
 """
 
 import os
+import sys
+import socket
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union
+import time
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from urllib.parse import urlsplit
 
+import orjson
 import requests
 import ollama
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from src.config.config import config
+from src.utils.http_session import get_session
+from src.utils.llm_cache import acached_call, cached_call
+
 logger = logging.getLogger(__name__)
 
+# The integration whose sessions the tools route through, set at startup
+_mcp_integration: Optional["MCPServerIntegration"] = None
+
+
+def set_mcp_integration(integration: Optional["MCPServerIntegration"]) -> None:
+    """
+    Register the MCP integration that tools should use for their calls.
+    
+    Args:
+        integration: The connected integration, or None to unregister
+    """
+    global _mcp_integration
+    _mcp_integration = integration
+
+
+def configure_event_loop() -> bool:
+    """
+    Make asyncio use uvloop's event loop, which cuts the per-message overhead of the
+    stdio pipes MCP servers are driven over.
+    
+    Call this before asyncio.run(). Set FALCON_NO_UVLOOP=1 to keep the default loop.
+    
+    Returns:
+        bool: True if uvloop was installed, False if the default loop is kept
+    """
+    if sys.platform == "win32" or os.environ.get('FALCON_NO_UVLOOP', '').lower() in ('1', 'true', 'yes'):
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    uvloop.install()
+    logger.debug("Using uvloop event loop")
+    return True
+
+
+def get_mcp_integration() -> Optional["MCPServerIntegration"]:
+    """
+    Get the MCP integration registered at startup.
+    
+    Returns:
+        Optional MCPServerIntegration if one is registered, None otherwise
+    """
+    return _mcp_integration
+
+
 class OllamaIntegration:
     """Interface for interacting with Ollama to run models locally."""
     
-    def __init__(self, model_name: str = "qwen3:8b"):
+    # (host, model_name) -> (checked_at, available), shared by all instances
+    _availability_cache: Dict[tuple, tuple] = {}
+    
+    # Sampling options callers can override per request
+    _SAMPLING_KEYS = ("temperature", "top_p", "top_k")
+    
+    def __init__(self, model_name: str = "qwen3:8b", host: Optional[str] = None,
+                 keep_alive: Optional[Union[str, int]] = None):
         """
         Initialize the Ollama integration.
         
         Args:
             model_name: The name of the model to use. Defaults to "qwen3:8b".
+            host: URL of the Ollama server. Defaults to ollama.server_url in config.
+            keep_alive: How long Ollama keeps the model loaded after a request, as a duration
+                string ("30m") or seconds; -1 keeps it loaded indefinitely. Defaults to
+                ollama.keep_alive in config.
         """
         self.model_name = model_name
+        self.keep_alive = keep_alive if keep_alive is not None else config.get('ollama.keep_alive', "30m")
+        self.host = (host or config.get('ollama.server_url', 'http://localhost:11434')).rstrip("/")
+        # One client per integration so generate/chat reuse its keep-alive connections
+        self.client = ollama.Client(host=self.host)
+        self.async_client = ollama.AsyncClient(host=self.host)
+        # Shared by every request that doesn't override sampling; never mutated
+        self._default_options = {"temperature": 0.7, "top_p": 0.9, "top_k": 40}
         self._check_availability()
     
     def _check_availability(self) -> bool:
         """
-        Check if Ollama is available and the specified model exists.
+        Check if the Ollama server is available.
+        
+        The result is cached per host and model for ollama.availability_ttl seconds,
+        so creating several integrations only probes the server once.
+        
+        Returns:
+            bool: True if Ollama is available, False otherwise.
+        """
+        key = (self.host, self.model_name)
+        cached = self._availability_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < config.get('ollama.availability_ttl', 60):
+            return cached[1]
+        
+        available = self._probe_server()
+        self._availability_cache[key] = (time.monotonic(), available)
+        return available
+    
+    def _probe_server(self) -> bool:
+        """
+        Check that the Ollama server is accepting connections.
+        
+        Only a TCP connection is opened; whether the model is present is checked by
+        warmup(), which pulls it if needed.
+        
+        Returns:
+            bool: True if the server is listening, False otherwise.
+        """
+        if not self._is_listening():
+            logger.warning("Could not connect to Ollama server. Make sure it's installed and running.")
+            return False
+        return True
+    
+    def _is_listening(self, timeout: float = 0.2) -> bool:
+        """
+        Check whether something accepts TCP connections on the server's host and port.
+        
+        Args:
+            timeout: Seconds to wait for the connection
+            
+        Returns:
+            bool: True if the connection succeeded, False otherwise.
+        """
+        url = urlsplit(self.host)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        try:
+            with socket.create_connection((url.hostname or "localhost", port), timeout=timeout):
+                return True
+        except (OSError, ValueError):
+            return False
+    
+    def _list_models(self) -> Optional[List[str]]:
+        """
+        Get the names of the models available on the Ollama server.
         
         Returns:
-            bool: True if Ollama is available and model exists, False otherwise.
+            Optional list of model names, or None if the server could not be reached.
         """
         try:
             # Check if Ollama server is running
-            response = requests.get("http://localhost:11434/api/tags")
+            response = get_session().get(f"{self.host}/api/tags", timeout=5)
             if response.status_code != 200:
                 logger.warning("Ollama server is not running. Please start it with 'ollama serve'")
-                return False
-            
-            # Check if the model exists
-            models = response.json().get("models", [])
-            model_exists = any(model["name"] == self.model_name for model in models)
+                return None
             
-            if not model_exists:
-                logger.info(f"Model {self.model_name} not found. Will pull when used.")
-            
-            return True
+            # orjson parses the tags payload several times faster than response.json()
+            return [model["name"] for model in orjson.loads(response.content).get("models", [])]
         except requests.RequestException:
             logger.warning("Could not connect to Ollama server. Make sure it's installed and running.")
+            return None
+        except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError):
+            logger.warning("Ollama server returned an unexpected model list")
+            return None
+    
+    def warmup(self) -> bool:
+        """
+        Load the model before the first request.
+        
+        Opens the pooled connection, pulls the model if the server does not have it, and
+        sends an empty prompt, which makes Ollama load the weights without generating.
+        
+        Returns:
+            bool: True if the model is loaded, False otherwise.
+        """
+        models = self._list_models()
+        if models is None:
+            return False
+        
+        if self.model_name not in models:
+            logger.info(f"Model {self.model_name} not found on the Ollama server")
+            if not self.pull_model():
+                return False
+        
+        try:
+            self.client.generate(model=self.model_name, prompt="", keep_alive=self.keep_alive)
+            logger.info(f"Model {self.model_name} loaded")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load model {self.model_name}: {str(e)}")
             return False
     
     def pull_model(self) -> bool:
@@ -67,7 +218,7 @@ class OllamaIntegration:
         """
         try:
             logger.info(f"Pulling model {self.model_name}...")
-            ollama.pull(self.model_name)
+            self.client.pull(self.model_name)
             logger.info(f"Model {self.model_name} pulled successfully")
             return True
         except Exception as e:
@@ -81,31 +232,63 @@ class OllamaIntegration:
         Args:
             prompt: The user prompt
             system: Optional system message
-            **kwargs: Additional parameters to pass to Ollama
+            **kwargs: Additional parameters to pass to Ollama, including keep_alive. Pass
+                cacheable=True to reuse stored responses even when temperature is above 0.
             
         Returns:
             Dict containing the response
         """
         try:
-            # Set default parameters if not provided
-            params = {
-                "model": self.model_name,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": kwargs.get("temperature", 0.7),
-                    "top_p": kwargs.get("top_p", 0.9),
-                    "top_k": kwargs.get("top_k", 40),
-                }
-            }
-            
-            # Add system message if provided
-            if system:
-                params["system"] = system
+            params = self._generate_params(prompt, system, kwargs)
             
             # Generate response
-            response = ollama.generate(**params)
-            return response
+            return self._call(self.client.generate, "ollama_generate", params, kwargs.get("cacheable"))
+        except Exception as e:
+            logger.error(f"Error generating response: {str(e)}")
+            return {"error": str(e)}
+    
+    def generate_stream(self, prompt: str, system: Optional[str] = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Generate a response using the Ollama model, yielding it as it is produced.
+        
+        Callers can start parsing partial output, or stop iterating once they have what
+        they need, which closes the connection without waiting for the rest of the
+        response. Streamed responses are not cached.
+        
+        Args:
+            prompt: The user prompt
+            system: Optional system message
+            **kwargs: Additional parameters to pass to Ollama, including keep_alive
+            
+        Yields:
+            Dict for each chunk; its "response" key holds the next piece of text and the
+            last chunk has "done" set to True
+        """
+        params = self._generate_params(prompt, system, kwargs)
+        params["stream"] = True
+        
+        try:
+            for chunk in self.client.generate(**params):
+                yield self._as_dict(chunk)
+        except Exception as e:
+            logger.error(f"Error generating response: {str(e)}")
+            yield {"error": str(e), "done": True}
+    
+    async def agenerate(self, prompt: str, system: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Generate a response using the Ollama model without blocking the event loop.
+        
+        Args:
+            prompt: The user prompt
+            system: Optional system message
+            **kwargs: Additional parameters, as for generate
+            
+        Returns:
+            Dict containing the response
+        """
+        try:
+            params = self._generate_params(prompt, system, kwargs)
+            return await self._acall(self.async_client.generate, "ollama_generate", params, kwargs.get("cacheable"))
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}")
             return {"error": str(e)}
@@ -116,44 +299,212 @@ class OllamaIntegration:
         
         Args:
             messages: List of message dictionaries with 'role' and 'content' keys
-            **kwargs: Additional parameters to pass to Ollama
+            **kwargs: Additional parameters to pass to Ollama, including keep_alive. Pass
+                cacheable=True to reuse stored responses even when temperature is above 0.
             
         Returns:
             Dict containing the response
         """
         try:
-            # Set default parameters if not provided
-            params = {
-                "model": self.model_name,
-                "messages": messages,
-                "stream": False,
-                "options": {
-                    "temperature": kwargs.get("temperature", 0.7),
-                    "top_p": kwargs.get("top_p", 0.9),
-                    "top_k": kwargs.get("top_k", 40),
-                }
-            }
+            params = self._chat_params(messages, kwargs)
             
             # Generate chat response
-            response = ollama.chat(**params)
-            return response
+            return self._call(self.client.chat, "ollama_chat", params, kwargs.get("cacheable"))
+        except Exception as e:
+            logger.error(f"Error in chat: {str(e)}")
+            return {"error": str(e)}
+    
+    async def achat(self, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """
+        Have a chat conversation with the Ollama model without blocking the event loop.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+            **kwargs: Additional parameters, as for chat
+            
+        Returns:
+            Dict containing the response
+        """
+        try:
+            params = self._chat_params(messages, kwargs)
+            return await self._acall(self.async_client.chat, "ollama_chat", params, kwargs.get("cacheable"))
         except Exception as e:
             logger.error(f"Error in chat: {str(e)}")
             return {"error": str(e)}
+    
+    def _generate_params(self, prompt: str, system: Optional[str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the parameters for a generate request.
+        
+        Args:
+            prompt: The user prompt
+            system: Optional system message
+            kwargs: Parameters passed by the caller
+            
+        Returns:
+            Dict of request parameters
+        """
+        # Set default parameters if not provided
+        params = {
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": False,
+            # Keep the model loaded so the next call does not pay for a reload
+            "keep_alive": kwargs.get("keep_alive", self.keep_alive),
+            "options": self._options(kwargs),
+        }
+        
+        # Add system message if provided
+        if system:
+            params["system"] = system
+        return params
+    
+    def _chat_params(self, messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the parameters for a chat request.
+        
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+            kwargs: Parameters passed by the caller
+            
+        Returns:
+            Dict of request parameters
+        """
+        return {
+            "model": self.model_name,
+            "messages": messages,
+            "stream": False,
+            "keep_alive": kwargs.get("keep_alive", self.keep_alive),
+            "options": self._options(kwargs),
+        }
+    
+    def _options(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the sampling options for a request.
+        
+        Args:
+            kwargs: Parameters passed by the caller
+            
+        Returns:
+            Dict of sampling options; the shared defaults when the caller overrides none
+        """
+        overrides = {k: kwargs[k] for k in self._SAMPLING_KEYS if k in kwargs}
+        if not overrides:
+            return self._default_options
+        return {**self._default_options, **overrides}
+    
+    def _call(self, method: Any, namespace: str, params: Dict[str, Any],
+              cacheable: Optional[bool]) -> Dict[str, Any]:
+        """
+        Call an Ollama client method, going through the response cache when the call is cacheable.
+        
+        Args:
+            method: The client method to call
+            namespace: Cache namespace for the method
+            params: Parameters for the call
+            cacheable: Whether to cache. Defaults to caching only deterministic (temperature 0) calls.
+            
+        Returns:
+            Dict containing the response
+        """
+        if cacheable is None:
+            cacheable = params["options"]["temperature"] == 0
+        if not cacheable:
+            return method(**params)
+        
+        return cached_call(namespace, self._cache_key(params), lambda: self._as_dict(method(**params)))
+    
+    async def _acall(self, method: Any, namespace: str, params: Dict[str, Any],
+                     cacheable: Optional[bool]) -> Dict[str, Any]:
+        """
+        Await an async Ollama client method, going through the response cache when the call is cacheable.
+        
+        Args:
+            method: The async client method to call
+            namespace: Cache namespace for the method
+            params: Parameters for the call
+            cacheable: Whether to cache. Defaults to caching only deterministic (temperature 0) calls.
+            
+        Returns:
+            Dict containing the response
+        """
+        if cacheable is None:
+            cacheable = params["options"]["temperature"] == 0
+        if not cacheable:
+            return await method(**params)
+        
+        async def _call() -> Dict[str, Any]:
+            return self._as_dict(await method(**params))
+        
+        return await acached_call(namespace, self._cache_key(params), _call)
+    
+    def _cache_key(self, params: Dict[str, Any]) -> tuple:
+        """
+        Build the response cache key parts for a request.
+        
+        Args:
+            params: Parameters for the call
+            
+        Returns:
+            tuple: The key parts
+        """
+        # keep_alive and stream don't change the response
+        return (self.host, {k: v for k, v in params.items() if k not in ("keep_alive", "stream")})
+    
+    @staticmethod
+    def _as_dict(response: Any) -> Dict[str, Any]:
+        """
+        Convert an Ollama response to a plain dict.
+        
+        Args:
+            response: A dict, or a response model from newer ollama clients
+            
+        Returns:
+            Dict containing the response
+        """
+        if hasattr(response, "model_dump"):
+            return response.model_dump()
+        return dict(response)
 
 
 class MCPServerIntegration:
     """Interface for interacting with MCP servers."""
     
+    # connect_to_server arguments for the servers the agents use
+    BRAVE_SEARCH_SERVER = {
+        "server_name": "brave-search",
+        "command": "npx",
+        "args": ["-y", "@modelcontextprotocol/server-brave-search"],
+    }
+    SEQUENTIAL_THINKING_SERVER = {
+        "server_name": "sequential-thinking",
+        "command": "npx",
+        "args": ["-y", "@modelcontextprotocol/server-sequential-thinking"],
+    }
+    CONTEXT7_SERVER = {
+        "server_name": "context7",
+        "command": "npx",
+        "args": ["-y", "@upstash/context7-mcp@latest"],
+    }
+    
     def __init__(self):
         """Initialize the MCP server integration."""
         self.active_sessions = {}
+        # server_name -> (task owning the transport and session, event that tells it to close)
+        self._server_tasks: Dict[str, tuple] = {}
+        # server_name -> semaphore bounding the requests in flight on that session
+        self._call_limits: Dict[str, asyncio.Semaphore] = {}
+        # server_name -> lock serializing connection attempts, so concurrent callers share one subprocess
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
     
     async def connect_to_server(self, server_name: str, command: str, args: List[str], 
                                env: Optional[Dict[str, str]] = None) -> Optional[ClientSession]:
         """
         Connect to an MCP server.
         
+        If a live session to the server already exists it is returned as is, without
+        starting another server process.
+        
         Args:
             server_name: Name identifier for the server connection
             command: Command to execute the server
@@ -163,29 +514,125 @@ class MCPServerIntegration:
         Returns:
             Optional ClientSession if successful, None otherwise
         """
-        try:
-            server_params = StdioServerParameters(
-                command=command,
-                args=args,
-                env=env
-            )
-            
-            # Connect to the server
-            stdio_transport = await stdio_client(server_params)
-            read_stream, write_stream = stdio_transport
-            
-            # Create a session
-            session = ClientSession(read_stream, write_stream)
-            await session.initialize()
+        lock = self._connect_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            session = self._live_session(server_name)
+            if session is not None:
+                return session
+            return await self._start_server(server_name, command, args, env)
+    
+    def _live_session(self, server_name: str) -> Optional[ClientSession]:
+        """
+        Get the session to a server if it is still connected.
+        
+        A session whose server task has ended is forgotten, so the next connect starts a new one.
+        
+        Args:
+            server_name: Name of the server
             
-            # Store the session
-            self.active_sessions[server_name] = session
+        Returns:
+            Optional ClientSession if connected, None otherwise
+        """
+        session = self.active_sessions.get(server_name)
+        if session is None:
+            return None
+        
+        task, _ = self._server_tasks[server_name]
+        if task.done():
+            del self.active_sessions[server_name]
+            del self._server_tasks[server_name]
+            del self._call_limits[server_name]
+            return None
+        return session
+    
+    async def _start_server(self, server_name: str, command: str, args: List[str],
+                            env: Optional[Dict[str, str]]) -> Optional[ClientSession]:
+        """
+        Start a server process and open a session to it.
+        
+        Args:
+            server_name: Name identifier for the server connection
+            command: Command to execute the server
+            args: Arguments to pass to the command
+            env: Optional environment variables
             
-            logger.info(f"Connected to MCP server: {server_name}")
-            return session
+        Returns:
+            Optional ClientSession if successful, None otherwise
+        """
+        server_params = StdioServerParameters(
+            command=command,
+            args=args,
+            env=env
+        )
+        
+        # The transport and session live in their own task until close_all_sessions, since
+        # they must be exited from the task that entered them
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(
+            self._serve(server_name, server_params, ready, stop), name=f"mcp-{server_name}"
+        )
+        
+        try:
+            session = await ready
         except Exception as e:
             logger.error(f"Failed to connect to MCP server {server_name}: {str(e)}")
+            await asyncio.gather(task, return_exceptions=True)
             return None
+        
+        # Store the session
+        self._server_tasks[server_name] = (task, stop)
+        self._call_limits[server_name] = asyncio.Semaphore(config.get('mcp.max_in_flight', 8))
+        self.active_sessions[server_name] = session
+        
+        logger.info(f"Connected to MCP server: {server_name}")
+        return session
+    
+    async def _serve(self, server_name: str, server_params: StdioServerParameters,
+                     ready: asyncio.Future, stop: asyncio.Event) -> None:
+        """
+        Hold a server's transport and session open until asked to stop.
+        
+        Args:
+            server_name: Name identifier for the server connection
+            server_params: Parameters for launching the server
+            ready: Resolved with the initialized session, or with the connection error
+            stop: Set to close the session and transport
+        """
+        try:
+            async with stdio_client(server_params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error(f"MCP server {server_name} session ended with an error: {str(e)}")
+        finally:
+            if not ready.done():
+                ready.set_exception(ConnectionError(f"MCP server {server_name} exited before initializing"))
+    
+    async def connect_all(self, configs: List[Dict[str, Any]]) -> Dict[str, ClientSession]:
+        """
+        Connect to several MCP servers concurrently.
+        
+        Args:
+            configs: connect_to_server arguments for each server
+            
+        Returns:
+            Dict mapping server names to sessions, for the servers that connected
+        """
+        sessions = await asyncio.gather(
+            *(self.connect_to_server(**server_config) for server_config in configs),
+            return_exceptions=True
+        )
+        return {
+            server_config["server_name"]: session
+            for server_config, session in zip(configs, sessions)
+            if session is not None and not isinstance(session, BaseException)
+        }
     
     async def connect_brave_search(self, api_key: str) -> Optional[ClientSession]:
         """
@@ -198,12 +645,7 @@ class MCPServerIntegration:
             Optional ClientSession if successful, None otherwise
         """
         env = {"BRAVE_API_KEY": api_key}
-        return await self.connect_to_server(
-            server_name="brave-search",
-            command="npx",
-            args=["-y", "@modelcontextprotocol/server-brave-search"],
-            env=env
-        )
+        return await self.connect_to_server(**self.BRAVE_SEARCH_SERVER, env=env)
     
     async def connect_sequential_thinking(self) -> Optional[ClientSession]:
         """
@@ -212,11 +654,7 @@ class MCPServerIntegration:
         Returns:
             Optional ClientSession if successful, None otherwise
         """
-        return await self.connect_to_server(
-            server_name="sequential-thinking",
-            command="npx",
-            args=["-y", "@modelcontextprotocol/server-sequential-thinking"]
-        )
+        return await self.connect_to_server(**self.SEQUENTIAL_THINKING_SERVER)
     
     async def connect_context7(self) -> Optional[ClientSession]:
         """
@@ -225,11 +663,7 @@ class MCPServerIntegration:
         Returns:
             Optional ClientSession if successful, None otherwise
         """
-        return await self.connect_to_server(
-            server_name="context7",
-            command="npx",
-            args=["-y", "@upstash/context7-mcp@latest"]
-        )
+        return await self.connect_to_server(**self.CONTEXT7_SERVER)
     
     async def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Optional[Any]:
         """
@@ -249,19 +683,79 @@ class MCPServerIntegration:
             return None
         
         try:
-            result = await session.call_tool(tool_name, arguments)
+            async with self._call_limits[server_name]:
+                result = await session.call_tool(tool_name, arguments)
             return result
         except Exception as e:
             logger.error(f"Error calling tool {tool_name} on server {server_name}: {str(e)}")
             return None
     
+    async def call_tools(self, calls: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Any]]:
+        """
+        Call several tools concurrently.
+        
+        MCP matches responses to requests by ID, so calls to the same server share its
+        session and are only limited by mcp.max_in_flight.
+        
+        Args:
+            calls: (server_name, tool_name, arguments) for each call
+            
+        Returns:
+            List of results in the order of the calls, with None for failed calls
+        """
+        return await asyncio.gather(
+            *(self.call_tool(server_name, tool_name, arguments) for server_name, tool_name, arguments in calls)
+        )
+    
+    def has_session(self, server_name: str) -> bool:
+        """
+        Check whether a session to a server is connected.
+        
+        Args:
+            server_name: Name of the server
+            
+        Returns:
+            bool: True if a session is active, False otherwise
+        """
+        return self._live_session(server_name) is not None
+    
+    async def call_tool_text(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """
+        Call a tool on an MCP server and return its text content.
+        
+        Args:
+            server_name: Name of the server to use
+            tool_name: Name of the tool to call
+            arguments: Arguments to pass to the tool
+            
+        Returns:
+            Optional text of the result if successful, None otherwise
+        """
+        result = await self.call_tool(server_name, tool_name, arguments)
+        if result is None or getattr(result, "isError", False):
+            return None
+        
+        return "\n".join(
+            item.text for item in getattr(result, "content", []) if getattr(item, "text", None)
+        )
+    
     async def close_all_sessions(self):
         """Close all active MCP server sessions."""
-        for server_name, session in self.active_sessions.items():
-            try:
-                await session.close()
+        # Each server task exits its session and transport once its stop event is set, so
+        # setting them all first lets the servers shut down concurrently
+        for _, stop in self._server_tasks.values():
+            stop.set()
+        
+        server_names = list(self._server_tasks)
+        results = await asyncio.gather(
+            *(task for task, _ in self._server_tasks.values()), return_exceptions=True
+        )
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error closing session for server {server_name}: {str(result)}")
+            else:
                 logger.info(f"Closed session for server: {server_name}")
-            except Exception as e:
-                logger.error(f"Error closing session for server {server_name}: {str(e)}")
         
-        self.active_sessions = {} 
\ No newline at end of file
+        self.active_sessions = {}
+        self._server_tasks = {}
+        self._call_limits = {} 
\ No newline at end of file
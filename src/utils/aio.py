@@ -0,0 +1,74 @@
+"""
+Asynchronous file helpers for the Falcon Agent system.
+
+File reads are blocking, so they are run on the default executor and awaited
+together instead of one after another on the event loop thread.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional
+
+from src.config.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def read_file(path: str, max_bytes: Optional[int] = None) -> Optional[bytes]:
+    """
+    Read a file, returning None if it cannot be read.
+
+    Args:
+        path: Path to the file
+        max_bytes: Read at most this many bytes if provided
+
+    Returns:
+        Optional[bytes]: The file content, or None if the file is missing or unreadable
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(-1 if max_bytes is None else max_bytes)
+    except OSError as e:
+        logger.debug(f"Could not read {path}: {e}")
+        return None
+
+
+def read_many_blocking(paths: Iterable[str], max_bytes: Optional[int] = None) -> Dict[str, bytes]:
+    """
+    Read several files from synchronous code.
+
+    Args:
+        paths: Paths to read
+        max_bytes: Read at most this many bytes per file if provided
+
+    Returns:
+        Dict[str, bytes]: Content keyed by path, for the files that could be read
+    """
+    contents = {}
+    for path in dict.fromkeys(paths):
+        data = read_file(path, max_bytes)
+        if data is not None:
+            contents[path] = data
+    return contents
+
+
+async def read_many(paths: Iterable[str], max_bytes: Optional[int] = None) -> Dict[str, bytes]:
+    """
+    Read several files concurrently.
+
+    Args:
+        paths: Paths to read
+        max_bytes: Read at most this many bytes per file if provided
+
+    Returns:
+        Dict[str, bytes]: Content keyed by path, for the files that could be read
+    """
+    unique_paths = list(dict.fromkeys(paths))
+    semaphore = asyncio.Semaphore(config.get('tools.max_concurrent_reads', 16))
+
+    async def _read(path: str) -> Optional[bytes]:
+        async with semaphore:
+            return await asyncio.to_thread(read_file, path, max_bytes)
+
+    results = await asyncio.gather(*(_read(path) for path in unique_paths))
+    return {path: data for path, data in zip(unique_paths, results) if data is not None}
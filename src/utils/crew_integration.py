@@ -1,16 +1,34 @@
 import os
-from typing import Dict, List, Any, Optional, Union
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 import uuid
 
+import orjson
 from crewai import Crew, Agent, Task, Process
 from crewai.tools import BaseTool
 
+from src.utils.llm_pool import LLMClientPool
 from src.utils.logging_utils import setup_logger
 from src.config.config import MODEL_CONFIGS, DEFAULT_MODEL
 
 logger = setup_logger(__name__)
 
+@lru_cache(maxsize=32)
+def _resolve_model_config(llm: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get a model's settings from MODEL_CONFIGS as an immutable snapshot.
+    
+    Args:
+        llm (str): Name of the model
+        
+    Returns:
+        Tuple[Tuple[str, Any], ...]: The model's (setting, value) pairs
+    """
+    return tuple(MODEL_CONFIGS.get(llm, {}).items())
+
 class CrewFactory:
     """
     Creates and manages CrewAI components for the agent system.
@@ -21,15 +39,21 @@ class CrewFactory:
     3. Creating and managing CrewAI crews
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, max_crews: int = 128):
         """
         Initialize the CrewFactory.
         
         Args:
             verbose (bool): Whether to enable verbose output from CrewAI
+            max_crews (int): Maximum number of crews to keep; the least recently used are dropped
         """
         self.verbose = verbose
-        self.crews = {}  # Dictionary mapping crew_id -> Crew object
+        self.max_crews = max_crews
+        self.crews: "OrderedDict[str, Crew]" = OrderedDict()  # crew_id -> Crew object, least recently used first
+        self.max_cached_agents = 64
+        self._agent_cache: "OrderedDict[bytes, Agent]" = OrderedDict()  # spec digest -> Agent, least recently used first
+        # Agents on the same model and sampling settings share one LLM client
+        self._llm_pool = LLMClientPool()
     
     def create_agent(self, 
                      role: str, 
@@ -46,14 +70,21 @@ class CrewFactory:
             goal (str): The agent's goal
             backstory (str): The agent's backstory
             tools (List[BaseTool], optional): Tools for the agent
-            llm (str): LLM to use for this agent
+            llm (str): LLM to use for this agent. Agents on the same model share a pooled
+                client; temperature and max_tokens from MODEL_CONFIGS[llm] or kwargs still
+                apply per agent.
             **kwargs: Additional arguments to pass to the Agent constructor
             
         Returns:
             Agent: The created CrewAI agent
         """
-        # Get the model config for this LLM
-        model_config = MODEL_CONFIGS.get(llm, {})
+        # Start from the model config for this LLM; additional kwargs take precedence
+        agent_kwargs = dict(_resolve_model_config(llm))
+        agent_kwargs.update(kwargs)
+        
+        # Sampling settings select the pooled client rather than going to the Agent
+        sampling = {key: agent_kwargs.pop(key) for key in ("temperature", "max_tokens") if key in agent_kwargs}
+        client = self._llm_pool.get(llm, **sampling)
         
         # Create the agent
         agent = Agent(
@@ -61,13 +92,59 @@ class CrewFactory:
             goal=goal,
             backstory=backstory,
             tools=tools or [],
-            llm=llm,
+            llm=client,
             verbose=self.verbose,
-            **{**model_config, **kwargs}  # Merge model config with additional kwargs
+            **agent_kwargs
         )
         
         return agent
     
+    @staticmethod
+    def _spec_digest(spec: Dict[str, Any]) -> bytes:
+        """
+        Hash an agent specification, ignoring its ID.
+        
+        Tools are identified by their class, so specs with the same kinds of tools match.
+        
+        Args:
+            spec (Dict[str, Any]): Specification for the agent
+            
+        Returns:
+            bytes: The digest of the specification
+        """
+        normalized = {k: v for k, v in spec.items() if k != "id"}
+        if normalized.get("tools"):
+            normalized["tools"] = [f"{type(tool).__module__}.{type(tool).__qualname__}" for tool in normalized["tools"]]
+        payload = orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _agent_from_spec(self, spec: Dict[str, Any], in_use: set) -> Agent:
+        """
+        Get an agent for a specification, reusing one built earlier for an identical spec.
+        
+        An agent is only reused across crews; if the cached agent is already part of the
+        crew being built, a new one is created so each crew member stays distinct.
+        
+        Args:
+            spec (Dict[str, Any]): Specification for the agent
+            in_use (set): IDs of the agent objects already in the crew being built
+            
+        Returns:
+            Agent: The agent
+        """
+        digest = self._spec_digest(spec)
+        agent = self._agent_cache.get(digest)
+        
+        if agent is None or id(agent) in in_use:
+            agent = self.create_agent(**{k: v for k, v in spec.items() if k != "id"})
+            self._agent_cache[digest] = agent
+            while len(self._agent_cache) > self.max_cached_agents:
+                self._agent_cache.popitem(last=False)
+        
+        self._agent_cache.move_to_end(digest)
+        in_use.add(id(agent))
+        return agent
+    
     def create_task(self, 
                     description: str, 
                     agent: Agent, 
@@ -144,6 +221,12 @@ class CrewFactory:
         
         # Store the crew
         self.crews[crew_id] = crew
+        self.crews.move_to_end(crew_id)
+        
+        # Drop the least recently used crews so finished ones don't accumulate
+        while len(self.crews) > self.max_crews:
+            evicted_id, _ = self.crews.popitem(last=False)
+            logger.debug("Evicted crew %s", evicted_id)
         
         return crew
     
@@ -157,7 +240,22 @@ class CrewFactory:
         Returns:
             Optional[Crew]: The crew or None if not found
         """
-        return self.crews.get(crew_id)
+        crew = self.crews.get(crew_id)
+        if crew is not None:
+            self.crews.move_to_end(crew_id)
+        return crew
+    
+    def release_crew(self, crew_id: str) -> bool:
+        """
+        Stop tracking a crew so it can be garbage collected.
+        
+        Args:
+            crew_id (str): The crew ID
+            
+        Returns:
+            bool: True if the crew was tracked, False otherwise
+        """
+        return self.crews.pop(crew_id, None) is not None
     
     def run_crew(self, crew_or_id: Union[Crew, str]) -> Any:
         """
@@ -177,7 +275,8 @@ class CrewFactory:
                 raise ValueError(f"No crew found with ID {crew_or_id}")
         
         # Run the crew
-        logger.info(f"Running crew with {len(crew.agents)} agents and {len(crew.tasks)} tasks")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running crew with %d agents and %d tasks", len(crew.agents), len(crew.tasks))
         result = crew.kickoff()
         
         return result
@@ -191,6 +290,8 @@ class CrewFactory:
         """
         Create a crew from agent and task specifications.
         
+        The specifications are not modified, so callers can reuse them across crews.
+        
         Args:
             agent_specs (List[Dict[str, Any]]): Specifications for the agents
             tasks_specs (List[Dict[str, Any]]): Specifications for the tasks
@@ -204,10 +305,11 @@ class CrewFactory:
         # Create the agents
         agents = []
         agent_map = {}  # Map agent IDs to Agent objects
+        in_use = set()
         
         for spec in agent_specs:
-            agent_id = spec.pop("id", str(uuid.uuid4()))
-            agent = self.create_agent(**spec)
+            agent_id = spec.get("id") or str(uuid.uuid4())
+            agent = self._agent_from_spec(spec, in_use)
             agents.append(agent)
             agent_map[agent_id] = agent
         
@@ -216,7 +318,7 @@ class CrewFactory:
         
         for spec in tasks_specs:
             # Get the agent for this task
-            agent_id = spec.pop("agent_id", None)
+            agent_id = spec.get("agent_id")
             if agent_id is None:
                 raise ValueError("task_specs must contain 'agent_id'")
             
@@ -225,7 +327,7 @@ class CrewFactory:
                 raise ValueError(f"No agent found with ID {agent_id}")
             
             # Create the task
-            task = self.create_task(agent=agent, **spec)
+            task = self.create_task(agent=agent, **{k: v for k, v in spec.items() if k != "agent_id"})
             tasks.append(task)
         
         # Create and return the crew
@@ -255,7 +357,7 @@ class CrewFactory:
             Crew: The created CrewAI crew
         """
         # Create the agent
-        agent = self.create_agent(**initial_agent_spec)
+        agent = self._agent_from_spec(initial_agent_spec, set())
         
         # Create the task
         task = self.create_task(agent=agent, **initial_task_spec)
@@ -291,12 +393,13 @@ class CrewFactory:
             Crew: The created CrewAI crew
         """
         # Create the manager agent
-        manager = self.create_agent(**manager_spec)
+        in_use = set()
+        manager = self._agent_from_spec(manager_spec, in_use)
         
         # Create the worker agents
         workers = []
         for spec in worker_specs:
-            worker = self.create_agent(**spec)
+            worker = self._agent_from_spec(spec, in_use)
             workers.append(worker)
         
         # Create the manager task
@@ -1,12 +1,15 @@
 import os
 import time
 import uuid
-import json
 import fcntl
 import signal
+import hashlib
+import threading
 from pathlib import Path
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import orjson
 
 from src.config.config import FILE_LOCK_DIR, FILE_LOCK_TIMEOUT
 from src.utils.logging_utils import setup_logger
@@ -17,6 +20,68 @@ class FileLockException(Exception):
     """Exception raised for file locking errors."""
     pass
 
+class _HeldLock:
+    """An flock held by this process on behalf of one owner, shared by that owner's FileLocks."""
+    
+    def __init__(self, lock_file, exclusive):
+        """
+        Initialize a held lock.
+        
+        Args:
+            lock_file: The open lock file holding the flock
+            exclusive (bool): Whether the flock is exclusive
+        """
+        self.lock_file = lock_file
+        self.exclusive = exclusive
+        self.depth = 1
+
+# Locks held by this process: target path -> owner_id -> _HeldLock. Lets an owner
+# re-acquire a path without touching disk, and rejects conflicting in-process requests early.
+_PROC_LOCKS = {}
+_PROC_LOCKS_MTX = threading.Lock()
+
+def _read_lock_record(f):
+    """
+    Read the lock record from an open lock file.
+    
+    Args:
+        f: The lock file, opened for reading in binary mode
+    
+    Returns:
+        dict: The lock record, or None if the file holds no valid record
+    """
+    f.seek(0)
+    return _parse_lock_record(f.read())
+
+def _parse_lock_record(data):
+    """
+    Parse the content of a lock file.
+    
+    Args:
+        data (bytes): The lock file content
+    
+    Returns:
+        dict: The lock record, or None if the content is not a valid record
+    """
+    if not data:
+        # New and released lock files are empty
+        return None
+    try:
+        record = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Records are rewritten in place and read without the flock, so a reader
+        # can catch one between the truncate and the write
+        return None
+    if not isinstance(record, dict) or not _LOCK_RECORD_FIELDS.issubset(record):
+        return None
+    return record
+
+# Fields every lock record written by FileLock.acquire has
+_LOCK_RECORD_FIELDS = frozenset({"path", "owner_id", "acquired_at", "expires_at", "exclusive"})
+
+# Upper bound on the size of a lock record, which holds a path and a few small fields
+_MAX_LOCK_RECORD_BYTES = 8192
+
 class FileLock:
     """
     File locking mechanism to prevent concurrent access to files.
@@ -33,21 +98,37 @@ class FileLock:
             timeout (int): Lock timeout in seconds
         """
         self.file_path = Path(file_path).resolve()
+        # String form of the path, computed once; names the lock file and goes in its record
+        self._path_key = str(self.file_path)
         self.owner_id = owner_id
         self.timeout = timeout
         self.lock_file_path = self._get_lock_file_path()
         self.lock_data = None
         self.locked = False
+        # The process-wide lock this FileLock holds a reference to; None when not held
+        self._held = None
     
     def _get_lock_file_path(self):
-        """Get the path to the lock file for the target file."""
-        file_hash = str(hash(str(self.file_path)))
+        """
+        Get the path to the lock file for the target file.
+        
+        Each target has its own lock file, holding a single record for that target,
+        so operations on different files never contend with each other.
+        """
+        # hash() is salted per process, so every process must derive the name from a stable digest
+        file_hash = hashlib.blake2b(os.fsencode(self._path_key), digest_size=8).hexdigest()
         return FILE_LOCK_DIR / f"{file_hash}.lock"
     
     def acquire(self, exclusive=True):
         """
         Acquire a lock on the file.
         
+        The lock is an flock on the lock file, held until release() (or until the
+        process exits), so it protects the whole critical section. The record written
+        to the lock file only describes the holder for is_locked and get_active_locks.
+        If this owner already holds the file in this process, the existing flock is
+        shared and only a counter is updated.
+        
         Args:
             exclusive (bool): If True, acquire an exclusive (write) lock,
                              otherwise acquire a shared (read) lock.
@@ -56,72 +137,71 @@ class FileLock:
             bool: True if lock was successfully acquired, False otherwise.
             
         Raises:
-            FileLockException: If the file is already locked by another agent
-                              and the lock has not expired.
+            FileLockException: If the file is already locked by another agent.
         """
-        # Create lock file if it doesn't exist
-        self.lock_file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        if not self.lock_file_path.exists():
-            with open(self.lock_file_path, 'w') as f:
-                f.write("{}")
+        if self.locked:
+            return True
         
-        # Check if the file is already locked
-        try:
-            with open(self.lock_file_path, 'r+') as f:
-                # Try to get an exclusive lock on the lock file itself
-                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {}
-                
-                # Check if there's an existing lock
-                if str(self.file_path) in data:
-                    lock_info = data[str(self.file_path)]
-                    
-                    # Check if the lock has expired
-                    lock_time = datetime.fromisoformat(lock_info["time"])
-                    expires_at = lock_time + timedelta(seconds=lock_info["timeout"])
-                    
-                    if datetime.now() < expires_at:
-                        # Lock has not expired
-                        if lock_info["owner_id"] != self.owner_id:
-                            # If another agent has the lock
-                            if exclusive or lock_info["exclusive"]:
-                                # If we want an exclusive lock or the existing lock is exclusive
-                                error_msg = f"File {self.file_path} is locked by {lock_info['owner_id']} until {expires_at}"
-                                logger.warning(error_msg)
-                                raise FileLockException(error_msg)
-                    else:
-                        # Lock has expired, we can take it
-                        logger.info(f"Lock on {self.file_path} has expired, acquiring new lock")
-                
-                # Create/Update the lock
-                self.lock_data = {
-                    "owner_id": self.owner_id,
-                    "time": datetime.now().isoformat(),
-                    "timeout": self.timeout,
-                    "exclusive": exclusive
-                }
-                
-                data[str(self.file_path)] = self.lock_data
-                
-                # Write the updated lock data
-                f.seek(0)
-                f.truncate()
-                json.dump(data, f, indent=2)
-                
+        with _PROC_LOCKS_MTX:
+            holders = _PROC_LOCKS.get(self._path_key, {})
+            held = holders.get(self.owner_id)
+            if held is not None:
+                # This owner already holds the file in this process; no disk work needed
+                held.depth += 1
+                self._held = held
                 self.locked = True
-                logger.info(f"{'Exclusive' if exclusive else 'Shared'} lock acquired on {self.file_path} by {self.owner_id}")
                 return True
-                
+            
+            for owner_id, other in holders.items():
+                if exclusive or other.exclusive:
+                    error_msg = f"File {self.file_path} is locked by {owner_id}"
+                    logger.warning(error_msg)
+                    raise FileLockException(error_msg)
+        
+        # Create the lock file if it doesn't exist, in the same open() call
+        try:
+            fd = os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except FileNotFoundError:
+            # Only the first lock in a fresh data directory pays for the mkdir
+            self.lock_file_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        f = os.fdopen(fd, 'r+b')
+        
+        try:
+            fcntl.flock(f, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
         except IOError:
-            # Could not get a lock on the lock file
-            error_msg = f"Could not acquire lock on {self.file_path}, lock file is busy"
-            logger.error(error_msg)
+            lock_info = _read_lock_record(f)
+            f.close()
+            
+            if lock_info is not None:
+                expires_at = datetime.fromtimestamp(lock_info["expires_at"])
+                error_msg = f"File {self.file_path} is locked by {lock_info['owner_id']} until {expires_at}"
+            else:
+                error_msg = f"Could not acquire lock on {self.file_path}, lock file is busy"
+            logger.warning(error_msg)
             raise FileLockException(error_msg)
+        
+        # Create/Update the lock record; times are epoch seconds so readers compare ints
+        now = int(time.time())
+        self.lock_data = {
+            "path": self._path_key,
+            "owner_id": self.owner_id,
+            "acquired_at": now,
+            "expires_at": now + self.timeout,
+            "exclusive": exclusive
+        }
+        
+        f.seek(0)
+        f.truncate()
+        f.write(orjson.dumps(self.lock_data))
+        f.flush()
+        
+        self._held = _HeldLock(f, exclusive)
+        with _PROC_LOCKS_MTX:
+            _PROC_LOCKS.setdefault(self._path_key, {})[self.owner_id] = self._held
+        self.locked = True
+        logger.info("%s lock acquired on %s by %s", "Exclusive" if exclusive else "Shared", self.file_path, self.owner_id)
+        return True
     
     def release(self):
         """
@@ -133,43 +213,37 @@ class FileLock:
         if not self.locked:
             return False
         
+        self.locked = False
+        held, self._held = self._held, None
+        
+        with _PROC_LOCKS_MTX:
+            held.depth -= 1
+            if held.depth > 0:
+                # Other FileLocks of this owner still rely on the flock
+                return True
+            
+            holders = _PROC_LOCKS.get(self._path_key, {})
+            if holders.get(self.owner_id) is held:
+                del holders[self.owner_id]
+                if not holders:
+                    del _PROC_LOCKS[self._path_key]
+        
+        f = held.lock_file
         try:
-            with open(self.lock_file_path, 'r+') as f:
-                # Try to get an exclusive lock on the lock file itself
-                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {}
-                
-                # Remove the lock if it belongs to us
-                if str(self.file_path) in data:
-                    lock_info = data[str(self.file_path)]
-                    if lock_info["owner_id"] == self.owner_id:
-                        del data[str(self.file_path)]
-                        
-                        # Write the updated lock data
-                        f.seek(0)
-                        f.truncate()
-                        json.dump(data, f, indent=2)
-                        
-                        self.locked = False
-                        logger.info(f"Lock released on {self.file_path} by {self.owner_id}")
-                        return True
-                    else:
-                        error_msg = f"Cannot release lock on {self.file_path}, it is owned by {lock_info['owner_id']}"
-                        logger.warning(error_msg)
-                        return False
-                else:
-                    # Lock doesn't exist
-                    self.locked = False
-                    return True
-                    
-        except IOError:
-            error_msg = f"Could not release lock on {self.file_path}, lock file is busy"
-            logger.error(error_msg)
+            # Clear the record if it is still ours; another shared holder may have replaced it
+            lock_info = _read_lock_record(f)
+            if lock_info is not None and lock_info["owner_id"] == self.owner_id:
+                f.truncate(0)
+            
+            fcntl.flock(f, fcntl.LOCK_UN)
+            logger.info("Lock released on %s by %s", self.file_path, self.owner_id)
+            return True
+        except IOError as e:
+            logger.error("Error releasing lock on %s: %s", self.file_path, e)
             return False
+        finally:
+            # Closing the descriptor drops the flock even if unlocking failed
+            f.close()
     
     def is_locked(self, by_owner=None):
         """
@@ -182,29 +256,21 @@ class FileLock:
             bool: True if the file is locked (by the specified owner if provided),
                  False otherwise.
         """
+        with _PROC_LOCKS_MTX:
+            holders = _PROC_LOCKS.get(self._path_key)
+            if holders and (by_owner is None or by_owner in holders):
+                return True
+        
         try:
-            with open(self.lock_file_path, 'r') as f:
-                # Try to get a shared lock on the lock file
-                fcntl.flock(f, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            with open(self.lock_file_path, 'rb') as f:
+                # Read without flock; an exclusive holder keeps it for its whole critical section
+                lock_info = _read_lock_record(f)
                 
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
+                # Check that the lock has not expired
+                if lock_info is None or time.time() >= lock_info["expires_at"]:
                     return False
                 
-                if str(self.file_path) in data:
-                    lock_info = data[str(self.file_path)]
-                    
-                    # Check if the lock has expired
-                    lock_time = datetime.fromisoformat(lock_info["time"])
-                    expires_at = lock_time + timedelta(seconds=lock_info["timeout"])
-                    
-                    if datetime.now() < expires_at:
-                        # Lock has not expired
-                        if by_owner is None or lock_info["owner_id"] == by_owner:
-                            return True
-                
-                return False
+                return by_owner is None or lock_info["owner_id"] == by_owner
                 
         except (IOError, FileNotFoundError):
             return False
@@ -246,6 +312,34 @@ def file_lock(file_path, owner_id, exclusive=True, timeout=FILE_LOCK_TIMEOUT):
         lock.release()
 
 
+def atomic_write_bytes(path, data):
+    """
+    Write a file so readers see either its old or its new content, never a partial write.
+    
+    The data goes to a temporary file in the same directory, which is synced and then
+    renamed over the target. Don't use this for lock files: replacing the inode would
+    detach the flock held on it.
+    
+    Args:
+        path (str or Path): Path to the file to write
+        data (bytes): The content to write
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def get_active_locks():
     """
     Get a dictionary of all active locks.
@@ -254,41 +348,38 @@ def get_active_locks():
         dict: A dictionary mapping file paths to lock information
     """
     active_locks = {}
+    now = time.time()
+    
+    try:
+        with os.scandir(FILE_LOCK_DIR) as entries:
+            lock_files = [entry.path for entry in entries if entry.name.endswith(".lock")]
+    except FileNotFoundError:
+        return active_locks
     
     # Check all lock files in the lock directory
-    for lock_file in FILE_LOCK_DIR.glob("*.lock"):
+    for lock_file in lock_files:
         try:
-            with open(lock_file, 'r') as f:
-                # Try to get a shared lock on the lock file
-                fcntl.flock(f, fcntl.LOCK_SH | fcntl.LOCK_NB)
-                
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    continue
-                
-                now = datetime.now()
-                
-                # Check each lock in the file
-                for file_path, lock_info in data.items():
-                    try:
-                        lock_time = datetime.fromisoformat(lock_info["time"])
-                        expires_at = lock_time + timedelta(seconds=lock_info["timeout"])
-                        
-                        # Only include non-expired locks
-                        if now < expires_at:
-                            active_locks[file_path] = {
-                                "owner_id": lock_info["owner_id"],
-                                "time": lock_time.isoformat(),
-                                "expires_at": expires_at.isoformat(),
-                                "exclusive": lock_info["exclusive"]
-                            }
-                    except (KeyError, ValueError):
-                        # Skip invalid lock data
-                        continue
-                    
-        except (IOError, FileNotFoundError):
+            # Lock files are tiny, so a single read gets the whole record
+            fd = os.open(lock_file, os.O_RDONLY)
+            try:
+                data = os.read(fd, _MAX_LOCK_RECORD_BYTES)
+            finally:
+                os.close(fd)
+        except OSError:
             # Skip if we can't read the lock file
             continue
+        
+        lock_info = _parse_lock_record(data)
+        if lock_info is None:
+            continue
+        
+        # Only include non-expired locks; dates are formatted just for the output
+        if now < lock_info["expires_at"]:
+            active_locks[lock_info["path"]] = {
+                "owner_id": lock_info["owner_id"],
+                "time": datetime.fromtimestamp(lock_info["acquired_at"]).isoformat(),
+                "expires_at": datetime.fromtimestamp(lock_info["expires_at"]).isoformat(),
+                "exclusive": lock_info["exclusive"]
+            }
     
     return active_locks 
\ No newline at end of file
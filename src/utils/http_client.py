@@ -0,0 +1,52 @@
+"""
+Shared asynchronous HTTP client for the Falcon Agent tools.
+
+Tools invoked from the asyncio-driven agent loop use this client in their
+``_arun`` implementations so that network calls are awaited instead of
+blocking the event loop. The connection pool is bounded from config to avoid
+exhausting sockets when many agents call tools concurrently.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+from src.config.config import config
+
+logger = logging.getLogger(__name__)
+
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    global _ASYNC_CLIENT
+
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed:
+        limits = httpx.Limits(
+            max_connections=config.get('http.max_connections', 500),
+            max_keepalive_connections=config.get('http.max_keepalive', 100),
+            keepalive_expiry=config.get('http.keepalive_expiry', 30),
+        )
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(config.get('http.timeout', 30.0)),
+            headers={"Accept": "application/json"},
+        )
+    return _ASYNC_CLIENT
+
+
+async def close_async_client() -> None:
+    """Close the shared async HTTP client and release its connections."""
+    global _ASYNC_CLIENT
+
+    if _ASYNC_CLIENT is not None:
+        await _ASYNC_CLIENT.aclose()
+        _ASYNC_CLIENT = None
+        logger.info("Closed shared async HTTP client")
@@ -0,0 +1,79 @@
+"""
+Shared HTTP session for the Falcon Agent tools.
+
+The tool modules talk to the same handful of MCP hosts and APIs over and over,
+so they share one pooled ``requests.Session`` instead of paying for a fresh
+TCP/TLS handshake on every call.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Headers for request bodies pre-encoded with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    """
+    Build a session with a pooled, retrying adapter mounted for HTTP and HTTPS.
+
+    Returns:
+        requests.Session: The configured session
+    """
+    retry = Retry(
+        total=config.get('http.max_retries', 2),
+        backoff_factor=config.get('http.backoff_factor', 0.2),
+        status_forcelist=[502, 503, 504],
+        # MCP endpoints are queried with POST but have no side effects
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.get('http.pool_connections', 10),
+        pool_maxsize=config.get('http.pool_maxsize', 50),
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _SESSION
+
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _create_session()
+    return _SESSION
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and release its pooled connections."""
+    global _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+            logger.info("Closed shared HTTP session")
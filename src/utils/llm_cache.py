@@ -0,0 +1,224 @@
+"""
+Response cache for agent LLM calls.
+
+Stages such as PRD generation and Goal Graph validation are often re-run with
+exactly the same inputs. This module stores agent results in a small SQLite
+database keyed by a SHA-256 of the call, so a repeated call returns the stored
+result instead of going back to the model.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+
+from src.config.config import DATA_DIR, config
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LLMResponseCache:
+    """Exact-match cache of agent results backed by SQLite with zlib-compressed values."""
+
+    def __init__(self, db_path: Optional[str] = None, ttl: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database. Defaults to data/cache/llm_responses.sqlite3.
+            ttl: Seconds a stored result stays valid. Defaults to llm_cache.ttl in config.
+        """
+        self.db_path = db_path or str(DATA_DIR / "cache" / "llm_responses.sqlite3")
+        self.ttl = ttl if ttl is not None else config.get('llm_cache.ttl', 24 * 60 * 60)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection, creating the database on first use.
+
+        Returns:
+            sqlite3.Connection: An open connection
+        """
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    DATA_DIR.joinpath("cache").mkdir(parents=True, exist_ok=True)
+                    with closing(sqlite3.connect(self.db_path)) as conn, conn:
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS responses ("
+                            "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                            "created_at REAL NOT NULL, value BLOB NOT NULL, "
+                            "PRIMARY KEY (namespace, key))"
+                        )
+                    self._initialized = True
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Hash the parts of a call into a cache key.
+
+        Args:
+            *parts: Values identifying the call (agent, method, arguments)
+
+        Returns:
+            str: The SHA-256 hex digest of the parts
+        """
+        payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, namespace: str, key: str) -> Any:
+        """
+        Look up a stored result.
+
+        Args:
+            namespace: The cache namespace (e.g. "prd")
+            key: The cache key
+
+        Returns:
+            The stored result, or the module's _MISSING sentinel if absent or expired
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT created_at, value FROM responses WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading LLM response cache: {e}")
+            return _MISSING
+
+        if row is None or time.time() - row[0] > self.ttl:
+            return _MISSING
+
+        return orjson.loads(zlib.decompress(row[1]))
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Store a result.
+
+        Args:
+            namespace: The cache namespace (e.g. "prd")
+            key: The cache key
+            value: The JSON-serializable result to store
+        """
+        try:
+            blob = zlib.compress(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS, default=str))
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (namespace, key, created_at, value) VALUES (?, ?, ?, ?)",
+                    (namespace, key, time.time(), blob)
+                )
+        except (sqlite3.Error, TypeError) as e:
+            logger.error(f"Error writing LLM response cache: {e}")
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove stored results.
+
+        Args:
+            namespace: Only clear this namespace if provided, otherwise clear everything
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                if namespace is None:
+                    conn.execute("DELETE FROM responses")
+                else:
+                    conn.execute("DELETE FROM responses WHERE namespace = ?", (namespace,))
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing LLM response cache: {e}")
+
+
+_cache = LLMResponseCache()
+
+
+def cached_run(agent: Any, *args: Any, namespace: str, method: str = "run") -> Any:
+    """
+    Call an agent method, reusing the stored result of an identical earlier call.
+
+    Only use this for calls whose result depends on their arguments alone;
+    calls that read or modify files must not be cached.
+
+    Args:
+        agent: The agent to call
+        *args: Arguments to pass to the method
+        namespace: Cache namespace for this stage (e.g. "prd", "goal_graph")
+        method: Name of the agent method to call. Defaults to "run".
+
+    Returns:
+        The method's result
+    """
+    key_parts = (
+        type(agent).__name__, getattr(agent, "llm", None), getattr(agent, "temperature", None), method, args
+    )
+    return cached_call(namespace, key_parts, lambda: getattr(agent, method)(*args))
+
+
+def cached_call(namespace: str, key_parts: tuple, call: Callable[[], Any]) -> Any:
+    """
+    Run a model call, reusing the stored result of an earlier call with the same key.
+
+    Args:
+        namespace: Cache namespace (e.g. "prd", "ollama_generate")
+        key_parts: Values identifying the call; hashed into the cache key
+        call: Performs the call on a miss. Its result must be JSON-serializable.
+
+    Returns:
+        The call's result
+    """
+    if not config.get('llm_cache.enabled', True):
+        return call()
+
+    key = _cache.make_key(*key_parts)
+    result = _cache.get(namespace, key)
+    if result is not _MISSING:
+        logger.info(f"LLM response cache hit ({namespace})")
+        return result
+
+    result = call()
+
+    # Don't pin failed generations
+    if not (isinstance(result, dict) and (result.get("status") == "error" or "error" in result)):
+        _cache.set(namespace, key, result)
+    return result
+
+
+async def acached_call(namespace: str, key_parts: tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Await a model call, reusing the stored result of an earlier call with the same key.
+
+    The SQLite lookups run on the default executor so they don't block the event loop.
+
+    Args:
+        namespace: Cache namespace (e.g. "ollama_chat")
+        key_parts: Values identifying the call; hashed into the cache key
+        call: Performs the call on a miss. Its result must be JSON-serializable.
+
+    Returns:
+        The call's result
+    """
+    if not config.get('llm_cache.enabled', True):
+        return await call()
+
+    key = _cache.make_key(*key_parts)
+    result = await asyncio.to_thread(_cache.get, namespace, key)
+    if result is not _MISSING:
+        logger.info(f"LLM response cache hit ({namespace})")
+        return result
+
+    result = await call()
+
+    # Don't pin failed generations
+    if not (isinstance(result, dict) and (result.get("status") == "error" or "error" in result)):
+        await asyncio.to_thread(_cache.set, namespace, key, result)
+    return result
@@ -0,0 +1,53 @@
+"""
+Shared LLM clients for the Falcon Agent system.
+
+Most roles run on the same model, so agents share one CrewAI ``LLM`` per model
+and sampling settings instead of each building its own client.
+"""
+
+import threading
+from typing import Dict, Tuple
+
+from crewai import LLM
+
+from src.config.config import DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS
+from src.utils.logging_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class LLMClientPool:
+    """Hands out one shared LLM client per (model, temperature, max_tokens)."""
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._clients: Dict[Tuple[str, float, int], LLM] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: str, temperature: float = DEFAULT_TEMPERATURE,
+            max_tokens: int = DEFAULT_MAX_TOKENS) -> LLM:
+        """
+        Get the shared client for a model, creating it on first use.
+
+        Args:
+            model (str): Name of the model
+            temperature (float): Sampling temperature
+            max_tokens (int): Maximum number of tokens to generate
+
+        Returns:
+            LLM: The shared client
+        """
+        key = (model, temperature, max_tokens)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = LLM(model=model, temperature=temperature, max_tokens=max_tokens)
+                self._clients[key] = client
+                logger.info(f"Created LLM client for {model}")
+        return client
+
+    def clear(self) -> None:
+        """Drop all pooled clients."""
+        with self._lock:
+            self._clients.clear()
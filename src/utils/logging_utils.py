@@ -1,14 +1,111 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from src.config.config import LOG_LEVEL, LOG_FILE
 
+# Loggers already set up, keyed by (name, log_level, log_file)
+_LOGGERS = {}
+# Handlers attached to loggers, keyed by (numeric_level, log_file), shared by every logger
+# with those settings so each log file is opened (and rotated) by a single handler
+_HANDLERS = {}
+# Background listeners that write queued records to the console and file handlers
+_LISTENERS = []
+_LOCK = threading.Lock()
+
+
+def _stop_listeners():
+    """Write out the records still queued and stop the listener threads."""
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
+class _SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that counts the bytes it writes instead of asking the stream.
+    
+    RotatingFileHandler checks the file position (and formats the record a second time)
+    for every record to decide whether to roll over; this handler formats once and
+    compares a running count against maxBytes.
+    """
+    
+    def _open(self):
+        """
+        Open the log file and start counting from its current size.
+        
+        Returns:
+            The opened stream
+        """
+        stream = super()._open()
+        self._bytes_written = stream.tell()
+        # Rolling over only makes sense for regular files (not e.g. /dev/null)
+        self._rotatable = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record):
+        """
+        Check whether writing a record would take the file past maxBytes.
+        
+        Args:
+            record (logging.LogRecord): The record to be written
+            
+        Returns:
+            bool: True if the file should be rolled over first
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(len(self.format(record)) + len(self.terminator))
+    
+    def _would_overflow(self, size):
+        """
+        Check whether writing size more characters would take the file past maxBytes.
+        
+        Args:
+            size (int): Length of the message to be written
+            
+        Returns:
+            bool: True if the file should be rolled over first
+        """
+        return (self.maxBytes > 0 and self._rotatable and self._bytes_written > 0
+                and self._bytes_written + size >= self.maxBytes)
+    
+    def emit(self, record):
+        """
+        Write a record, rolling the file over first if it would grow past maxBytes.
+        
+        Args:
+            record (logging.LogRecord): The record to write
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._would_overflow(len(msg)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._bytes_written += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logger(name, log_level=None, log_file=None):
     """
     Set up a logger with console and file handlers.
     
+    Calling this again with the same arguments returns the logger set up the first time.
+    
     Args:
         name (str): Name of the logger
         log_level (str, optional): Logging level. Defaults to value in config.
@@ -23,19 +120,64 @@ def setup_logger(name, log_level=None, log_file=None):
     if log_file is None:
         log_file = LOG_FILE
     
+    key = (name, log_level, log_file)
+    logger = _LOGGERS.get(key)
+    if logger is not None:
+        return logger
+    
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
         numeric_level = logging.INFO
     
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(numeric_level)
+    with _LOCK:
+        handlers = _HANDLERS.get((numeric_level, log_file))
+        error = None
+        if handlers is None:
+            output_handlers, error = _create_handlers(numeric_level, log_file)
+            
+            # Loggers only put records on a queue; one listener thread does the writing,
+            # so logging callers never wait on console or file I/O
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+            listener.start()
+            _LISTENERS.append(listener)
+            
+            handlers = [QueueHandler(log_queue)]
+            _HANDLERS[(numeric_level, log_file)] = handlers
+        
+        # Create logger
+        logger = logging.getLogger(name)
+        logger.setLevel(numeric_level)
+        
+        # Remove existing handlers if any
+        if logger.hasHandlers():
+            logger.handlers.clear()
+        
+        # Add handlers to logger
+        for handler in handlers:
+            logger.addHandler(handler)
+        
+        _LOGGERS[key] = logger
     
-    # Remove existing handlers if any
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    if error is not None:
+        logger.error(f"Failed to create file handler: {error}")
+    
+    return logger
+
+
+def _create_handlers(numeric_level, log_file):
+    """
+    Create the console and file handlers for a log level and file.
     
+    Args:
+        numeric_level (int): Logging level
+        log_file (str): Path to log file
+        
+    Returns:
+        tuple: The handlers, and the error if the log file couldn't be opened (in which
+            case only the console handler is returned)
+    """
     # Create formatters
     console_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -52,17 +194,11 @@ def setup_logger(name, log_level=None, log_file=None):
     # Create file handler
     try:
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        file_handler = RotatingFileHandler(
+        file_handler = _SizeTrackingRotatingFileHandler(
             log_file, maxBytes=10*1024*1024, backupCount=5  # 10MB with 5 backups
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(file_formatter)
-        
-        # Add handlers to logger
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        return [console_handler, file_handler], None
     except Exception as e:
-        logger.addHandler(console_handler)
-        logger.error(f"Failed to create file handler: {e}")
-    
-    return logger 
\ No newline at end of file
+        return [console_handler], e 
\ No newline at end of file
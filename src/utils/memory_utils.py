@@ -1,16 +1,56 @@
 import os
-import json
 import time
-from typing import Dict, List, Any, Optional, Union
+import bisect
+import struct
+from typing import Dict, Iterable, List, Any, Optional, Set, Union
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 from src.config.config import DATA_DIR
 from src.utils.logging_utils import setup_logger
-from src.utils.file_utils import file_lock
+from src.utils.file_utils import atomic_write_bytes, file_lock
 
 logger = setup_logger(__name__)
 
+# Each record in the packed memory log is its byte length followed by the orjson-encoded memory
+_RECORD_HEADER = struct.Struct("<Q")
+
+# Records closer together than this are fetched with one read, skipping over the bytes between them
+_READ_COALESCE_GAP = 64 * 1024
+
+
+def fmt_ts(t: float) -> str:
+    """
+    Format a memory timestamp for display.
+    
+    Args:
+        t (float): Seconds since the epoch, as stored in memory items
+    
+    Returns:
+        str: The timestamp in ISO 8601 format
+    """
+    return datetime.fromtimestamp(t).isoformat()
+
+
+def _ts_value(timestamp: Union[float, str]) -> float:
+    """
+    Get a memory timestamp as seconds since the epoch.
+    
+    Memories stored before timestamps were numeric carry ISO 8601 strings.
+    
+    Args:
+        timestamp (float or str): The stored timestamp
+    
+    Returns:
+        float: Seconds since the epoch
+    """
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp).timestamp()
+    return timestamp
+
+
 class MemoryManager:
     """
     Manages both short-term and long-term memory for agents.
@@ -35,33 +75,90 @@ class MemoryManager:
         # Create the agent memory directory if it doesn't exist
         os.makedirs(self.agent_memory_dir, exist_ok=True)
         
-        # Initialize short-term memory (in-memory)
+        # Initialize short-term memory (in-memory), kept in timestamp order, with the
+        # timestamps, categories and lowercased searchable text of the items alongside
+        # for cheap filtering
         self.short_term_memory = []
+        self._stm_timestamps: List[float] = []
+        self._stm_categories: List[str] = []
+        self._stm_text: List[tuple] = []
+        
+        # Long-term memories are appended to a single packed log; index entries hold their offsets
+        self.memory_log_path = self.agent_memory_dir / "memories.bin"
+        self._log_fd: Optional[int] = None
         
-        # Load long-term memory index
-        self.long_term_index_path = self.agent_memory_dir / "memory_index.json"
+        # Load long-term memory index; one JSON entry per line, only ever appended to
+        self.long_term_index_path = self.agent_memory_dir / "memory_index.jsonl"
         self.long_term_index = self._load_long_term_index()
+        
+        # Older entries carry ISO timestamps; compare everything as epoch seconds
+        for entry in self.long_term_index:
+            entry["timestamp"] = _ts_value(entry["timestamp"])
+        
+        # Trigram -> positions in long_term_index of the entries whose searchable text contains it,
+        # and the lowercased searchable text of each entry
+        self._trigram_index: Dict[str, Set[int]] = {}
+        self._ltm_text: List[tuple] = []
+        for position, entry in enumerate(self.long_term_index):
+            self._index_for_search(position, entry)
     
     def _load_long_term_index(self) -> List[Dict[str, Any]]:
         """
         Load the long-term memory index file.
         
+        An index in the older single-array memory_index.json format is converted on first load.
+        
         Returns:
             List[Dict[str, Any]]: The memory index
         """
         if not os.path.exists(self.long_term_index_path):
-            # Create an empty index file
-            with file_lock(self.long_term_index_path, self.agent_id):
-                with open(self.long_term_index_path, 'w') as f:
-                    json.dump([], f)
+            return self._migrate_long_term_index()
+        
+        try:
+            with open(self.long_term_index_path, 'rb') as f:
+                data = f.read()
+        except IOError as e:
+            logger.error("Error loading memory index: %s", e)
+            return []
+        
+        if data and not data.endswith(b"\n"):
+            # Terminate an entry cut short by a crash, so the next append starts on its own line
+            with open(self.long_term_index_path, 'ab') as f:
+                f.write(b"\n")
+        
+        index = []
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                index.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # A crash mid-append can only damage the entry being written
+                logger.warning("Skipping damaged entry in memory index %s", self.long_term_index_path)
+        return index
+    
+    def _migrate_long_term_index(self) -> List[Dict[str, Any]]:
+        """
+        Convert a memory_index.json file to the line-per-entry index.
+        
+        Returns:
+            List[Dict[str, Any]]: The converted index, or an empty list if there is nothing to convert
+        """
+        legacy_path = self.agent_memory_dir / "memory_index.json"
+        if not os.path.exists(legacy_path):
             return []
         
         try:
-            with file_lock(self.long_term_index_path, self.agent_id, exclusive=False):
-                with open(self.long_term_index_path, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Error loading memory index: {e}")
+            with file_lock(legacy_path, self.agent_id, exclusive=False):
+                with open(legacy_path, 'rb') as f:
+                    index = orjson.loads(f.read())
+            
+            atomic_write_bytes(self.long_term_index_path, b"".join(orjson.dumps(entry) + b"\n" for entry in index))
+            os.remove(legacy_path)
+            logger.info("Converted memory index for agent %s to %s", self.agent_id, self.long_term_index_path.name)
+            return index
+        except (orjson.JSONDecodeError, IOError) as e:
+            logger.error("Error converting memory index: %s", e)
             return []
     
     def add_to_short_term(self, memory_item: Union[str, Dict[str, Any]], category: str = "general"):
@@ -75,16 +172,25 @@ class MemoryManager:
         if isinstance(memory_item, str):
             memory_item = {"content": memory_item}
         
-        # Ensure the memory item has all required fields
+        # Ensure the memory item has all required fields; timestamps are epoch seconds,
+        # formatted with fmt_ts only for display
+        now = time.time()
         memory_entry = {
-            "id": f"stm_{int(time.time())}_{len(self.short_term_memory)}",
-            "timestamp": datetime.now().isoformat(),
+            "id": f"stm_{int(now)}_{len(self.short_term_memory)}",
+            "timestamp": now,
             "category": category,
             **memory_item
         }
-        
-        self.short_term_memory.append(memory_entry)
-        logger.debug(f"Added to short-term memory: {memory_entry['id']}")
+        memory_entry["timestamp"] = _ts_value(memory_entry["timestamp"])
+        
+        # Timestamps normally increase, so this appends; an item carrying its own older
+        # timestamp is inserted in place
+        position = bisect.bisect_right(self._stm_timestamps, memory_entry["timestamp"])
+        self.short_term_memory.insert(position, memory_entry)
+        self._stm_timestamps.insert(position, memory_entry["timestamp"])
+        self._stm_categories.insert(position, memory_entry["category"])
+        self._stm_text.insert(position, self._searchable_text(memory_entry))
+        logger.debug("Added to short-term memory: %s", memory_entry["id"])
     
     def add_to_long_term(self, memory_item: Union[str, Dict[str, Any]], category: str = "general", importance: int = 1):
         """
@@ -98,69 +204,213 @@ class MemoryManager:
         Returns:
             str: The ID of the stored memory
         """
-        if isinstance(memory_item, str):
-            memory_item = {"content": memory_item}
+        memory_ids = self.add_many_to_long_term([memory_item], category=category, importance=importance)
+        return memory_ids[0] if memory_ids else None
+    
+    def add_many_to_long_term(self, memory_items: Iterable[Union[str, Dict[str, Any]]],
+                              category: str = "general", importance: int = 1) -> List[str]:
+        """
+        Add several items to long-term memory with one write to the packed log and one to the index.
         
+        Args:
+            memory_items (Iterable[str or Dict]): The memory items to add
+            category (str): The category of items that don't carry their own
+            importance (int): Importance level (1-5)
+        
+        Returns:
+            List[str]: The IDs of the stored memories, or an empty list if they could not be stored
+        """
         # Ensure valid importance
         importance = min(max(importance, 1), 5)
+        now = time.time()
         
-        # Create a unique ID for this memory
-        memory_id = f"ltm_{int(time.time())}_{len(self.long_term_index)}"
-        
-        # Create the memory entry
-        memory_entry = {
-            "id": memory_id,
-            "timestamp": datetime.now().isoformat(),
-            "category": category,
-            "importance": importance,
-            **memory_item
-        }
-        
-        # Store the memory in its own file
-        memory_path = self.agent_memory_dir / f"{memory_id}.json"
-        
-        try:
-            with file_lock(memory_path, self.agent_id):
-                with open(memory_path, 'w') as f:
-                    json.dump(memory_entry, f, indent=2)
+        memory_entries = []
+        for memory_item in memory_items:
+            if isinstance(memory_item, str):
+                memory_item = {"content": memory_item}
             
-            # Add to the index
-            index_entry = {
-                "id": memory_id,
-                "timestamp": memory_entry["timestamp"],
+            # Create the memory entry with a unique ID
+            memory_entry = {
+                "id": f"ltm_{int(now)}_{len(self.long_term_index) + len(memory_entries)}",
+                "timestamp": now,
                 "category": category,
                 "importance": importance,
-                "path": str(memory_path)
+                **memory_item
             }
+            memory_entry["timestamp"] = _ts_value(memory_entry["timestamp"])
+            memory_entries.append(memory_entry)
+        
+        if not memory_entries:
+            return []
+        
+        try:
+            # Store the memories in the packed log
+            locations = self._append_memories([orjson.dumps(memory_entry) for memory_entry in memory_entries])
             
-            # Add a summary if the memory item has content
-            if "content" in memory_item:
-                index_entry["summary"] = memory_item["content"][:200] + ("..." if len(memory_item["content"]) > 200 else "")
+            # Build the index entries
+            index_entries = []
+            for memory_entry, (offset, length) in zip(memory_entries, locations):
+                index_entry = {
+                    "id": memory_entry["id"],
+                    "timestamp": memory_entry["timestamp"],
+                    "category": memory_entry["category"],
+                    "importance": importance,
+                    "offset": offset,
+                    "length": length
+                }
+                
+                # Add a summary if the memory item has content
+                if "content" in memory_entry:
+                    content = memory_entry["content"]
+                    index_entry["summary"] = content[:200] + ("..." if len(content) > 200 else "")
+                index_entries.append(index_entry)
             
-            # Update the index file
-            with file_lock(self.long_term_index_path, self.agent_id):
-                with open(self.long_term_index_path, 'r+') as f:
-                    try:
-                        index = json.load(f)
-                    except json.JSONDecodeError:
-                        index = []
-                    
-                    index.append(index_entry)
-                    
-                    # Write the updated index
-                    f.seek(0)
-                    f.truncate()
-                    json.dump(index, f, indent=2)
+            # Append the entries to the index file. A single write to a file opened with
+            # O_APPEND lands whole at the end, so no lock or read-modify-write is needed
+            with open(self.long_term_index_path, 'ab') as f:
+                f.write(b"".join(orjson.dumps(index_entry) + b"\n" for index_entry in index_entries))
             
             # Update the in-memory index
-            self.long_term_index.append(index_entry)
+            for index_entry in index_entries:
+                self._index_for_search(len(self.long_term_index), index_entry)
+                self.long_term_index.append(index_entry)
             
-            logger.debug(f"Added to long-term memory: {memory_id}")
-            return memory_id
+            logger.debug("Added %d items to long-term memory", len(index_entries))
+            return [index_entry["id"] for index_entry in index_entries]
             
-        except (IOError, json.JSONDecodeError) as e:
-            logger.error(f"Error adding to long-term memory: {e}")
-            return None
+        except IOError as e:
+            logger.error("Error adding to long-term memory: %s", e)
+            return []
+    
+    def _log_fileno(self) -> int:
+        """
+        Get the descriptor of the packed memory log, opening it on first use.
+        
+        Returns:
+            int: The file descriptor
+        """
+        if self._log_fd is None:
+            self._log_fd = os.open(self.memory_log_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._log_fd
+    
+    def _append_memories(self, blobs: List[bytes]) -> List[tuple]:
+        """
+        Append encoded memories to the packed log.
+        
+        The records go out in a single O_APPEND write, so concurrent writers never
+        interleave and their offsets are known from where the write ended.
+        
+        Args:
+            blobs (List[bytes]): The orjson-encoded memories
+        
+        Returns:
+            List[tuple]: The (offset, length) of each encoded memory within the log
+        """
+        fd = self._log_fileno()
+        records = b"".join(_RECORD_HEADER.pack(len(blob)) + blob for blob in blobs)
+        if os.write(fd, records) != len(records):
+            raise IOError(f"Short write to memory log {self.memory_log_path}")
+        
+        offset = os.lseek(fd, 0, os.SEEK_CUR) - len(records)
+        locations = []
+        for blob in blobs:
+            offset += _RECORD_HEADER.size
+            locations.append((offset, len(blob)))
+            offset += len(blob)
+        return locations
+    
+    def _read_memory(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read the memory an index entry points to.
+        
+        Args:
+            entry (Dict[str, Any]): The index entry
+        
+        Returns:
+            Dict[str, Any]: The memory item
+        """
+        if "offset" not in entry:
+            # Memories stored before the packed log each have their own file
+            memory_path = Path(entry["path"])
+            with file_lock(memory_path, self.agent_id, exclusive=False):
+                with open(memory_path, 'rb') as f:
+                    return orjson.loads(f.read())
+        
+        data = os.pread(self._log_fileno(), entry["length"], entry["offset"])
+        if len(data) != entry["length"]:
+            raise IOError(f"Memory {entry['id']} is truncated in {self.memory_log_path}")
+        return orjson.loads(data)
+    
+    def _read_memories(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Read the memories several index entries point to, batching reads from the packed log.
+        
+        Records are read in offset order, and records close together in the log are
+        fetched with a single pread.
+        
+        Args:
+            entries (List[Dict[str, Any]]): The index entries
+        
+        Returns:
+            List[Dict[str, Any]]: The memory items in the order of the entries, skipping
+                any that could not be read
+        """
+        memories: Dict[int, Dict[str, Any]] = {}
+        packed = sorted((i for i, entry in enumerate(entries) if "offset" in entry),
+                        key=lambda i: entries[i]["offset"])
+        
+        # Group the packed records into runs that are each fetched with one read
+        runs: List[List[int]] = []
+        for i in packed:
+            if runs:
+                last = entries[runs[-1][-1]]
+                if entries[i]["offset"] - (last["offset"] + last["length"]) <= _READ_COALESCE_GAP:
+                    runs[-1].append(i)
+                    continue
+            runs.append([i])
+        
+        for run in runs:
+            start = entries[run[0]]["offset"]
+            end = max(entries[i]["offset"] + entries[i]["length"] for i in run)
+            try:
+                data = os.pread(self._log_fileno(), end - start, start)
+            except IOError as e:
+                for i in run:
+                    logger.error("Error reading memory item %s: %s", entries[i]["id"], e)
+                continue
+            
+            view = memoryview(data)
+            for i in run:
+                entry = entries[i]
+                begin = entry["offset"] - start
+                try:
+                    if begin + entry["length"] > len(data):
+                        raise IOError(f"Memory {entry['id']} is truncated in {self.memory_log_path}")
+                    memories[i] = orjson.loads(view[begin:begin + entry["length"]])
+                except (IOError, orjson.JSONDecodeError) as e:
+                    logger.error("Error reading memory item %s: %s", entry["id"], e)
+        
+        # Memories stored before the packed log are read from their own files
+        for i, entry in enumerate(entries):
+            if "offset" not in entry:
+                try:
+                    memories[i] = self._read_memory(entry)
+                except (IOError, orjson.JSONDecodeError) as e:
+                    logger.error("Error reading memory item %s: %s", entry["id"], e)
+        
+        return [memories[i] for i in range(len(entries)) if i in memories]
+    
+    def close(self):
+        """Close the packed memory log."""
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def __del__(self):
+        """Close the packed memory log when the manager is garbage collected."""
+        # __init__ may have failed before the attribute was set
+        if getattr(self, "_log_fd", None) is not None:
+            self.close()
     
     def get_from_short_term(self, category: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -173,15 +423,20 @@ class MemoryManager:
         Returns:
             List[Dict[str, Any]]: The memory items
         """
-        # Filter by category if specified
-        if category:
-            filtered = [item for item in self.short_term_memory if item["category"] == category]
-        else:
-            filtered = self.short_term_memory.copy()
+        # Items are kept in timestamp order, so walk back from the newest until we have enough
+        results = []
+        if limit <= 0:
+            return results
         
-        # Sort by timestamp (newest first) and limit
-        sorted_memories = sorted(filtered, key=lambda x: x["timestamp"], reverse=True)
-        return sorted_memories[:limit]
+        for position in range(len(self.short_term_memory) - 1, -1, -1):
+            # Filter by category if specified
+            if category and self._stm_categories[position] != category:
+                continue
+            
+            results.append(self.short_term_memory[position])
+            if len(results) == limit:
+                break
+        return results
     
     def get_from_long_term(self, category: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -208,18 +463,7 @@ class MemoryManager:
         )
         
         # Limit the number of results
-        results = []
-        for entry in sorted_memories[:limit]:
-            try:
-                memory_path = Path(entry["path"])
-                with file_lock(memory_path, self.agent_id, exclusive=False):
-                    with open(memory_path, 'r') as f:
-                        memory_item = json.load(f)
-                        results.append(memory_item)
-            except (IOError, json.JSONDecodeError) as e:
-                logger.error(f"Error reading memory item {entry['id']}: {e}")
-        
-        return results
+        return self._read_memories(sorted_memories[:limit])
     
     def search_memory(self, query: str, category: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -237,63 +481,134 @@ class MemoryManager:
         results = []
         
         # Search short-term memory
-        for item in self.short_term_memory:
-            if category and item["category"] != category:
+        for position, item in enumerate(self.short_term_memory):
+            if category and self._stm_categories[position] != category:
                 continue
             
             # Check if query is in content or other fields
-            if self._item_matches_query(item, query):
+            if self._item_matches_query(self._stm_text[position], query):
                 results.append(item)
         
-        # Search long-term memory index
-        for entry in self.long_term_index:
+        # Search long-term memory index, only looking at entries that contain every trigram of the query
+        positions = self._search_candidates(query)
+        if positions is None:
+            positions = range(len(self.long_term_index))
+        else:
+            positions = sorted(positions)
+        
+        hits = []
+        for position in positions:
+            entry = self.long_term_index[position]
             if category and entry["category"] != category:
                 continue
             
             # Check if query is in summary or other indexed fields
-            if self._item_matches_query(entry, query):
-                try:
-                    memory_path = Path(entry["path"])
-                    with file_lock(memory_path, self.agent_id, exclusive=False):
-                        with open(memory_path, 'r') as f:
-                            memory_item = json.load(f)
-                            results.append(memory_item)
-                except (IOError, json.JSONDecodeError) as e:
-                    logger.error(f"Error reading memory item {entry['id']}: {e}")
+            if self._item_matches_query(self._ltm_text[position], query):
+                hits.append(entry)
+        results.extend(self._read_memories(hits))
         
         # Sort by timestamp (newest first) and limit
-        sorted_results = sorted(results, key=lambda x: x["timestamp"], reverse=True)
+        sorted_results = sorted(results, key=lambda x: _ts_value(x["timestamp"]), reverse=True)
         return sorted_results[:limit]
     
-    def _item_matches_query(self, item: Dict[str, Any], query: str) -> bool:
+    @staticmethod
+    def _trigrams(text: str) -> Iterable[str]:
         """
-        Check if a memory item matches the search query.
+        Get the three-character substrings of a text.
         
         Args:
-            item (Dict[str, Any]): The memory item
-            query (str): The search query
+            text (str): The text, already lowercased
         
         Returns:
-            bool: True if the item matches, False otherwise
+            Iterable[str]: The trigrams
+        """
+        return (text[i:i + 3] for i in range(len(text) - 2))
+    
+    @staticmethod
+    def _searchable_text(item: Dict[str, Any]) -> tuple:
+        """
+        Get the lowercased text of the fields of a memory item that search looks at.
+        
+        Args:
+            item (Dict[str, Any]): The memory item or index entry
+        
+        Returns:
+            tuple: The lowercased content, summary and category the item has
+        """
+        return tuple(item[field].lower() for field in ("content", "summary", "category")
+                     if isinstance(item.get(field), str))
+    
+    def _index_for_search(self, position: int, entry: Dict[str, Any]):
+        """
+        Add a long-term index entry to the trigram index.
+        
+        Args:
+            position (int): Position of the entry in long_term_index, which must be the next one
+            entry (Dict[str, Any]): The index entry
         """
-        # Check in content field
-        if "content" in item and query in item["content"].lower():
-            return True
+        texts = self._searchable_text(entry)
+        self._ltm_text.append(texts)
+        for text in texts:
+            for trigram in self._trigrams(text):
+                self._trigram_index.setdefault(trigram, set()).add(position)
+    
+    def _search_candidates(self, query: str) -> Optional[Set[int]]:
+        """
+        Find the long-term index entries that may contain the query.
+        
+        Any field containing the query contains all of its trigrams, so the result
+        never misses a match; candidates are still checked with _item_matches_query.
+        
+        Args:
+            query (str): The search query, already lowercased
+        
+        Returns:
+            Optional[Set[int]]: Positions of the candidate entries, or None if the
+                query is too short to narrow the search
+        """
+        if len(query) < 3:
+            return None
         
-        # Check in summary field (index entries)
-        if "summary" in item and query in item["summary"].lower():
-            return True
+        postings = []
+        for trigram in set(self._trigrams(query)):
+            positions = self._trigram_index.get(trigram)
+            if not positions:
+                return set()
+            postings.append(positions)
+        
+        # Intersect starting from the rarest trigram
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for positions in postings[1:]:
+            candidates &= positions
+            if not candidates:
+                break
+        return candidates
+    
+    @staticmethod
+    def _item_matches_query(texts: tuple, query: str) -> bool:
+        """
+        Check if a memory item matches the search query.
         
-        # Check in category
-        if query in item["category"].lower():
-            return True
+        Args:
+            texts (tuple): The item's lowercased searchable text, from _searchable_text
+            query (str): The search query, already lowercased
         
+        Returns:
+            bool: True if the item matches, False otherwise
+        """
+        for text in texts:
+            if query in text:
+                return True
         return False
     
     def clear_short_term_memory(self):
         """Clear all short-term memory."""
         self.short_term_memory = []
-        logger.info(f"Cleared short-term memory for agent {self.agent_id}")
+        self._stm_timestamps = []
+        self._stm_categories = []
+        self._stm_text = []
+        logger.info("Cleared short-term memory for agent %s", self.agent_id)
     
     def transfer_short_to_long_term(self, importance: int = 1):
         """
@@ -302,21 +617,19 @@ class MemoryManager:
         Args:
             importance (int): Importance level (1-5)
         """
+        memory_items = []
         for item in self.short_term_memory:
             # Copy the item without its short-term specific fields
             memory_item = item.copy()
             memory_item.pop("id", None)  # Remove short-term ID
-            
-            # Add to long-term memory
-            self.add_to_long_term(
-                memory_item, 
-                category=item["category"], 
-                importance=importance
-            )
+            memory_items.append(memory_item)
+        
+        # Add to long-term memory in one batch
+        self.add_many_to_long_term(memory_items, importance=importance)
         
         # Clear short-term memory
         self.clear_short_term_memory()
-        logger.info(f"Transferred short-term memory to long-term storage for agent {self.agent_id}")
+        logger.info("Transferred short-term memory to long-term storage for agent %s", self.agent_id)
     
     def summarize_memory(self, category: Optional[str] = None, timeframe: Optional[str] = None) -> str:
         """